@@ -2,15 +2,17 @@
 
 Each manager is a single deepagents agent with:
 - Sync tool functions (framework handles async)
-- Model specified as string ("openai:gpt-4") -- no BaseChatModel needed
+- Model specified as string ("openai:gpt-4") -- create_deep_agent resolves it
+  with the installed deepagents' provider defaults
 - Default StateBackend (ephemeral) -- NO FilesystemBackend (restricts disk access)
 - Agents read corpus files ONLY through read_corpus_file tool
 - Built-in tools (write_todos, read_todos) still available for planning
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from deepagents import create_deep_agent
+from langchain_core.language_models import BaseChatModel
 
 from src.prompts.prompt_library import PromptLibrary
 from src.tools.corpus_reader import read_corpus_file
@@ -24,7 +26,7 @@ from src.tools.code_executor import execute_python
 # ============================================================================
 
 def create_drool_manager(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Drool Manager -- flat agent, no sub-agents.
@@ -42,7 +44,7 @@ def create_drool_manager(
 
 
 def create_model_manager(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Model Manager -- flat agent, no sub-agents.
@@ -59,7 +61,7 @@ def create_model_manager(
 
 
 def create_outbound_manager(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Outbound Manager -- flat agent, no sub-agents.
@@ -76,7 +78,7 @@ def create_outbound_manager(
 
 
 def create_transformation_manager(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Transformation Manager -- flat agent, no sub-agents.
@@ -93,7 +95,7 @@ def create_transformation_manager(
 
 
 def create_inbound_manager(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Inbound Manager -- flat agent, no sub-agents.
@@ -110,7 +112,7 @@ def create_inbound_manager(
 
 
 def create_reviewer_supervisor(
-  model: str,
+  model: Union[str, BaseChatModel],
   model_provider: Optional[str] = None,
 ) -> Any:
   """Create Reviewer/Supervisor -- flat agent with code execution for .docx.
@@ -165,8 +167,12 @@ def create_all_managers(
 # Internal helpers
 # ============================================================================
 
-def _model_kwargs(model: str, model_provider: Optional[str] = None) -> Dict[str, Any]:
-  """Build kwargs dict for create_deep_agent model params."""
-  if model_provider:
-    return {"model": model, "model_provider": model_provider}
+def _model_kwargs(model: Union[str, BaseChatModel], model_provider: Optional[str] = None) -> Dict[str, Any]:
+  """Build kwargs dict for create_deep_agent model params.
+
+  create_deep_agent takes no model_provider, so a provider override is folded
+  into the "provider:model" string it resolves.
+  """
+  if model_provider and isinstance(model, str):
+    return {"model": f"{model_provider}:{model}"}
   return {"model": model}
@@ -7,7 +7,7 @@ LLM model is specified as a deepagents-compatible string (e.g. "openai:gpt-4").
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
@@ -81,6 +81,12 @@ class Config:
     p = Path(raw)
     return p if p.exists() else None
 
+  @property
+  def response_cache_dir(self) -> Optional[Path]:
+    """Optional directory for the manager response cache (disabled when unset)."""
+    raw = os.getenv("RESPONSE_CACHE_DIR")
+    return Path(raw) if raw else None
+
   @property
   def max_file_size_mb(self) -> int:
     return int(os.getenv("MAX_FILE_SIZE_MB", "50"))
@@ -97,10 +103,29 @@ class Config:
   def reviewer_timeout_sec(self) -> int:
     return int(os.getenv("REVIEWER_TIMEOUT_SEC", "600"))
 
+  @property
+  def manager_timeouts_sec(self) -> Dict[str, int]:
+    """Per-manager timeout overrides, e.g. 'drool=120,model=120,reviewer=900'.
+
+    Managers not listed fall back to REVIEWER_TIMEOUT_SEC / AGENT_TIMEOUT_SEC.
+    """
+    raw = os.getenv("MANAGER_TIMEOUTS_SEC", "")
+    timeouts: Dict[str, int] = {}
+    for item in raw.split(","):
+      name, sep, value = item.partition("=")
+      if sep and name.strip():
+        timeouts[name.strip()] = int(value)
+    return timeouts
+
   @property
   def max_retries(self) -> int:
     return int(os.getenv("MAX_RETRIES", "2"))
 
+  @property
+  def llm_concurrency(self) -> int:
+    """Max manager LLM invocations in flight at once (bounds fan-out to avoid provider 429s)."""
+    return max(1, int(os.getenv("LLM_CONCURRENCY", "10")))
+
   # =================================================================
   # Token Tracking & Cost
   # =================================================================
@@ -6,7 +6,52 @@ Length validation. Extensible for Bedrock guardrails later.
 
 import re
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Pattern, Sequence, Tuple
+
+# Content moderation patterns (MVP -- will be replaced with Bedrock guardrails)
+_BANNED_PATTERNS: List[Tuple[str, str]] = [
+  (r"(?i)\b(?:kill|murder|assassinat|massacre|slaughter)\b.*\b(?:people|person|human|child)", "Violence"),
+  (r"(?i)\b(?:sexual\s+abuse|rape|molestation|child\s+porn)", "Sexual abuse"),
+  (r"(?i)\b(?:hate\s+speech|racial\s+slur|white\s+supremac|ethnic\s+cleansing)", "Hate speech"),
+  (r"(?i)\b(?:suicide\s+method|how\s+to\s+harm|self[\-\s]harm\s+instruction)", "Self-harm"),
+  (r"(?i)\b(?:bomb\s+making|weapon\s+instruction|explosive\s+recipe)", "Dangerous content"),
+]
+
+
+_GLOBAL_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scoped(pattern: str) -> str:
+  """Turn leading global inline flags into a scoped group so patterns can be OR-ed."""
+  m = _GLOBAL_FLAGS.match(pattern)
+  if m:
+    return f"(?{m.group(1)}:{pattern[m.end():]})"
+  return f"(?:{pattern})"
+
+
+def _compile_patterns(
+  patterns: Sequence[Tuple[str, str]],
+) -> Tuple[Optional[Pattern[str]], List[Tuple[Pattern[str], str]]]:
+  """Compile each pattern once, plus a combined alternation used as a prefilter.
+
+  Clean queries (the common case) are rejected by a single scan of the combined
+  pattern; per-category patterns only run when something matched. Patterns with
+  groups can't be OR-ed safely (backreferences shift, named groups collide), so
+  the prefilter is None for them and every pattern is checked on its own.
+  """
+  compiled: List[Tuple[Pattern[str], str]] = []
+  for pattern, category in patterns:
+    try:
+      compiled.append((re.compile(pattern), category))
+    except re.error:
+      pass
+  if any(p.groups for p, _ in compiled):
+    return None, compiled
+  combined = re.compile("|".join(_scoped(p.pattern) for p, _ in compiled) or r"(?!)")
+  return combined, compiled
+
+
+_COMBINED_PATTERN, _COMPILED_PATTERNS = _compile_patterns(_BANNED_PATTERNS)
 
 
 @dataclass
@@ -25,14 +70,20 @@ class InputGuardrail:
     self.min_query_length = 3
     self.max_query_length = 5000
 
-    # Content moderation patterns (MVP -- will be replaced with Bedrock guardrails)
-    self.banned_patterns: List[Tuple[str, str]] = [
-      (r"(?i)\b(kill|murder|assassinat|massacre|slaughter)\b.*\b(people|person|human|child)", "Violence"),
-      (r"(?i)\b(sexual\s+abuse|rape|molestation|child\s+porn)", "Sexual abuse"),
-      (r"(?i)\b(hate\s+speech|racial\s+slur|white\s+supremac|ethnic\s+cleansing)", "Hate speech"),
-      (r"(?i)\b(suicide\s+method|how\s+to\s+harm|self[\-\s]harm\s+instruction)", "Self-harm"),
-      (r"(?i)\b(bomb\s+making|weapon\s+instruction|explosive\s+recipe)", "Dangerous content"),
-    ]
+    self.banned_patterns = _BANNED_PATTERNS
+
+  @property
+  def banned_patterns(self) -> Tuple[Tuple[str, str], ...]:
+    return self._banned_patterns
+
+  @banned_patterns.setter
+  def banned_patterns(self, patterns: Sequence[Tuple[str, str]]) -> None:
+    """Replacing the patterns recompiles them; the defaults reuse the import-time compile."""
+    self._banned_patterns = tuple(patterns)
+    if list(self._banned_patterns) == _BANNED_PATTERNS:
+      self._combined, self._compiled = _COMBINED_PATTERN, _COMPILED_PATTERNS
+    else:
+      self._combined, self._compiled = _compile_patterns(self._banned_patterns)
 
   def validate_input(
     self,
@@ -71,16 +122,14 @@ class InputGuardrail:
       ))
 
     # Content moderation
-    for pattern, category in self.banned_patterns:
-      try:
-        if re.search(pattern, user_query):
+    if self._combined is None or self._combined.search(user_query):
+      for pattern, category in self._compiled:
+        if pattern.search(user_query):
           violations.append(GuardrailViolation(
             rule_name="content_moderation",
             message=f"Content flagged: {category}",
             severity="error",
           ))
-      except re.error:
-        pass
 
     is_valid = all(v.severity != "error" for v in violations)
     return is_valid, violations
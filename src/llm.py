@@ -2,8 +2,13 @@
 
 Creates BaseChatModel instances from config (model string + optional provider).
 Works with OpenAI, Bedrock, Ollama, etc. via langchain's init_chat_model.
+Instances are memoized per (model, provider, temperature), so repeat callers
+share one client (and its HTTP / boto3 connection pool).
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 
@@ -20,10 +25,15 @@ def get_chat_model(temperature: float = 0.0) -> BaseChatModel:
       temperature: LLM temperature (default 0.0 for deterministic output).
 
   Returns:
-      Configured BaseChatModel instance.
+      Configured BaseChatModel instance (shared across calls with the same settings).
   """
   config = get_config()
-  kwargs = {"model": config.llm_model, "temperature": temperature}
-  if config.llm_model_provider:
-    kwargs["model_provider"] = config.llm_model_provider
+  return _chat_model(config.llm_model, config.llm_model_provider or None, temperature)
+
+
+@lru_cache(maxsize=16)
+def _chat_model(model: str, provider: Optional[str], temperature: float) -> BaseChatModel:
+  kwargs = {"model": model, "temperature": temperature}
+  if provider:
+    kwargs["model_provider"] = provider
   return init_chat_model(**kwargs)
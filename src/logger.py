@@ -11,6 +11,17 @@ from datetime import datetime
 import structlog
 
 
+def _round_timings(logger, method_name, event_dict):
+  """Round float durations at render time: *_ms to 1 decimal, *_sec to 2."""
+  for key, value in event_dict.items():
+    if isinstance(value, float):
+      if key.endswith("_ms"):
+        event_dict[key] = round(value, 1)
+      elif key.endswith("_sec"):
+        event_dict[key] = round(value, 2)
+  return event_dict
+
+
 class CustomLogger:
   """Structured logger with file + console output."""
 
@@ -58,6 +69,8 @@ class CustomLogger:
 
     structlog.configure(
       processors=[
+        structlog.stdlib.filter_by_level,
+        _round_timings,
         structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
         structlog.processors.add_log_level,
         structlog.processors.EventRenamer(to="event"),
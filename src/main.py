@@ -3,8 +3,10 @@
 import argparse
 import asyncio
 import json
+import os
 import sys
 from pathlib import Path
+from typing import Iterator
 
 from src.config import get_config
 from src.logger import get_logger
@@ -14,6 +16,23 @@ from src.models import MessageStatus
 logger = get_logger(__name__)
 
 
+def _iter_corpus_files(corpus_dir: Path) -> Iterator[str]:
+  """Yield corpus-relative paths of files in subdirectories (top-level files are skipped).
+
+  os.walk classifies entries from the directory listing itself, so no
+  per-file stat and no intermediate list of every entry.
+  """
+  root = str(corpus_dir)
+  prefix = os.path.join(root, "")
+  for dirpath, _, filenames in os.walk(root):
+    if dirpath == root:
+      continue
+    # os.walk joins onto root, so a prefix strip replaces Path.relative_to
+    rel_dir = dirpath.removeprefix(prefix)
+    for name in filenames:
+      yield os.path.join(rel_dir, name)
+
+
 async def main():
   """Main CLI entry point."""
   parser = argparse.ArgumentParser(
@@ -55,11 +74,7 @@ Examples:
     logger.error("corpus_not_found", path=str(corpus_dir))
     sys.exit(1)
 
-  corpus_files = [
-    str(f.relative_to(corpus_dir))
-    for f in corpus_dir.rglob("*")
-    if f.is_file() and f.parent != corpus_dir
-  ]
+  corpus_files = list(_iter_corpus_files(corpus_dir))
 
   logger.info("corpus_scanned", files=len(corpus_files), path=str(corpus_dir))
 
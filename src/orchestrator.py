@@ -4,7 +4,7 @@ Architecture (simplified -- no sub-agents):
   - 6 flat managers: Drool, Model, Outbound, Transformation, Inbound, Reviewer
   - Execution flow:
     1. Pre-filter drool files via LLM-based filter
-    2. Drool + Model run IN PARALLEL (asyncio.gather)
+    2. Drool + Model run IN PARALLEL (asyncio.TaskGroup)
     3. Outbound -> Transformation -> Inbound run SEQUENTIALLY
        Each step receives ALL prior outputs via file-based sharing
     4. Reviewer validates; if gaps found, requests manager reruns (max retries)
@@ -16,15 +16,19 @@ Architecture (simplified -- no sub-agents):
 """
 
 import asyncio
+import json
+import os
 import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.config import get_config
 from src.execution_logging import ExecutionLogger
 from src.guardrails import get_input_guardrail
 from src.logger import get_logger
+from src.response_cache import ResponseCache, fingerprint_corpus, fingerprint_contents
 from src.models import (
   ExecutionContext,
   ExecutionResult,
@@ -34,11 +38,36 @@ from src.models import (
   ReprocessRequest,
 )
 from src.agents.agent_definitions import create_all_managers
+from src.prompts.prompt_library import PromptLibrary
 from src.tools.drool_filter import filter_drool_files
-from src.tools.agent_output import save_agent_output, clear_agent_outputs
+from src.tools.agent_output import (
+  get_agent_output_path,
+  save_agent_output,
+  save_agent_output_chunks,
+  clear_agent_outputs,
+  has_agent_outputs,
+)
 
 logger = get_logger(__name__)
 
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
+# Prior outputs each manager may read, in pipeline order
+_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+  "drool": (),
+  "model": (),
+  "outbound": ("drool", "model"),
+  "transformation": ("drool", "model", "outbound"),
+  "inbound": ("drool", "model", "outbound", "transformation"),
+  "reviewer": ("drool", "model", "outbound", "transformation", "inbound"),
+}
+
+_STATUS_WARNING = {
+  MessageStatus.TIMEOUT: "timed out",
+  MessageStatus.PARTIAL: "produced partial results",
+  MessageStatus.ERROR: "encountered an error",
+}
+
 
 def group_files_by_workbook(
   files: List[str],
@@ -55,13 +84,10 @@ def group_files_by_workbook(
     return flat
   groups: Dict[Tuple[str, str], List[str]] = {}
   for path in files:
-    p = Path(path)
-    parent = str(p.parent) if p.parent != Path(".") else ""
-    name = p.name
-    if delimiter in name:
-      key = (parent, name.split(delimiter)[0])
-    else:
-      key = (parent, name)
+    # String split, not Path: this runs once per corpus file
+    parent, name = os.path.split(path)
+    # partition leaves name whole when the delimiter is absent
+    key = (parent, name.partition(delimiter)[0])
     groups.setdefault(key, []).append(path)
   ordered = sorted(groups.items(), key=lambda x: x[0])
   result: List[List[str]] = [g for _, g in ordered]
@@ -82,6 +108,71 @@ def _chunk_groups(groups: List[List[str]], max_per: int) -> List[List[str]]:
   return out
 
 
+@lru_cache(maxsize=None)
+def _prior_outputs_section(available_outputs: Tuple[str, ...]) -> str:
+  """Prompt section listing prior outputs; built once per distinct dependency set."""
+  output_list = "\n".join(f"  - {a} (read with: read_agent_output('{a}'))" for a in available_outputs)
+  return (
+    f"PREVIOUS AGENT OUTPUTS AVAILABLE:\n{output_list}\n\n"
+    f"Use the read_agent_output tool to read each previous agent's FULL output. "
+    f"These contain the complete analysis from prior pipeline stages.\n\n"
+  )
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_gaps(content: str) -> List[Dict[str, Any]]:
+  """Extract the reviewer's gap list from its output (a {"gaps": [...]} JSON object).
+
+  The object may be embedded in markdown or a code fence; outputs that never
+  mention "gaps" skip decoding entirely.
+  """
+  marker = content.find('"gaps"')
+  if marker < 0:
+    return []
+  # Try enclosing '{' positions from nearest outward; raw_decode stops at the object's end
+  start = content.rfind("{", 0, marker)
+  while start >= 0:
+    try:
+      obj, _ = _JSON_DECODER.raw_decode(content, start)
+    except ValueError:
+      obj = None
+    if isinstance(obj, dict) and isinstance(obj.get("gaps"), list):
+      return [_normalize_gap(g) for g in obj["gaps"] if isinstance(g, dict)]
+    start = content.rfind("{", 0, start)
+  return []
+
+
+def _normalize_gap(gap: Dict[str, Any]) -> Dict[str, Any]:
+  """Coerce an LLM-written gap to the shape feedback handling expects.
+
+  agent_id, domain and feedback become str and missing_items a list of str, so
+  fingerprinting and de-duplication never meet unhashable values. Non-string
+  items (e.g. {"entity": "Account"}) are kept as their JSON text.
+  """
+  items = gap.get("missing_items")
+  if isinstance(items, str):
+    items = [items]
+  elif not isinstance(items, list):
+    items = []
+  return {
+    **gap,
+    "agent_id": str(gap.get("agent_id", gap.get("manager", "unknown"))),
+    "domain": str(gap.get("domain") or ""),
+    "feedback": str(gap.get("feedback") or ""),
+    "missing_items": [i if isinstance(i, str) else json.dumps(i) for i in items],
+  }
+
+
+def _gap_fingerprint(gaps: List[Dict[str, Any]]) -> FrozenSet[Tuple[str, Tuple[str, ...]]]:
+  """Order-insensitive identity of a reviewer gap list: (agent, sorted missing items) per gap."""
+  return frozenset(
+    (g.get("agent_id", g.get("manager", "unknown")), tuple(sorted(g.get("missing_items", []))))
+    for g in gaps
+  )
+
+
 def _message_content_to_str(raw: Any) -> str:
   """Normalize AIMessage/last message content to str (content can be list of blocks)."""
   if raw is None:
@@ -111,8 +202,13 @@ class BRDOrchestrator:
     self.context: Optional[ExecutionContext] = None
     self._drool_files: List[str] = []
     self._non_drool_files: List[str] = []
-    self._completed_agents: List[str] = []
+    self._completed_agents: Set[str] = set()
+    self._prompt_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
     self._golden_brd_path: Optional[Path] = None
+    self._llm_sem = asyncio.Semaphore(self.config.llm_concurrency)
+    self._manager_timeouts = self.config.manager_timeouts_sec
+    self._response_cache: Optional[ResponseCache] = None
+    self._corpus_fingerprint = ""
 
     logger.info(
       "orchestrator_initialized",
@@ -152,16 +248,29 @@ class BRDOrchestrator:
       execution_id=str(uuid.uuid4()),
     )
 
-    # Clear previous agent outputs (offload sync I/O)
-    await asyncio.to_thread(clear_agent_outputs)
-    self._completed_agents = []
+    self._completed_agents = set()
+    self._prompt_cache = {}
+    # asyncio primitives bind to the loop that first waits on them; a fresh one per run
+    # lets the same orchestrator be reused under another asyncio.run
+    self._llm_sem = asyncio.Semaphore(self.config.llm_concurrency)
 
-    # Categorize files: drool (.drl) vs non-drool
-    self._drool_files = [f for f in corpus_files if f.endswith(".drl")]
-    self._non_drool_files = [f for f in corpus_files if not f.endswith(".drl")]
+    # Categorize files: drool (.drl) vs non-drool (single pass)
+    drool: List[str] = []
+    non_drool: List[str] = []
+    for f in corpus_files:
+      (drool if f.endswith(".drl") else non_drool).append(f)
+    self._drool_files, self._non_drool_files = drool, non_drool
 
     self._golden_brd_path = golden_brd_path if golden_brd_path is not None else self.config.golden_brd_path
 
+    # Optional response cache for repeat runs over an unchanged corpus
+    cache_dir = self.config.response_cache_dir
+    self._response_cache = ResponseCache(cache_dir) if cache_dir else None
+    if self._response_cache:
+      self._corpus_fingerprint = await asyncio.to_thread(
+        fingerprint_corpus, self.config.corpus_dir, corpus_files,
+      )
+
     # Create all managers
     self.managers = create_all_managers(
       model=self.config.llm_model,
@@ -179,8 +288,11 @@ class BRDOrchestrator:
     )
 
     try:
-      # Phase 0: Pre-filter drool files via LLM
-      filtered_drool = await self._filter_drool_files(user_query)
+      # Phase 0: Pre-filter drool files via LLM; clearing previous outputs is independent, so overlap it
+      _, filtered_drool = await asyncio.gather(
+        self._clear_previous_outputs(),
+        self._filter_drool_files(user_query),
+      )
 
       # Phase 1: Drool + Model in parallel (Model runs per workbook group)
       logger.info("phase_1_parallel", agents=["drool", "model"])
@@ -201,25 +313,26 @@ class BRDOrchestrator:
 
       # Finalize
       elapsed = self.context.get_elapsed_time_sec()
+      token_summary = self.context.token_tracker.get_summary()
       logger.info(
         "pipeline_completed",
-        elapsed_sec=round(elapsed, 2),
+        elapsed_sec=elapsed,
         messages=len(self.context.all_messages),
-        token_summary=self.context.token_tracker.get_summary(),
+        token_summary=token_summary,
       )
 
       return ExecutionResult(
         status=MessageStatus.SUCCESS,
         all_messages=self.context.all_messages,
-        token_summary=self.context.token_tracker.get_summary(),
+        token_summary=token_summary,
         execution_time_sec=elapsed,
         execution_id=self.context.execution_id,
-        warnings=self._collect_warnings(),
+        warnings=self._collect_warnings(token_summary),
       )
 
     except Exception as e:
       elapsed = self.context.get_elapsed_time_sec()
-      logger.error("pipeline_failed", error=str(e), elapsed_sec=round(elapsed, 2))
+      logger.error("pipeline_failed", error=str(e), elapsed_sec=elapsed)
       return ExecutionResult(
         status=MessageStatus.ERROR,
         all_messages=self.context.all_messages,
@@ -229,6 +342,11 @@ class BRDOrchestrator:
         execution_id=self.context.execution_id,
       )
 
+  async def _clear_previous_outputs(self) -> None:
+    """Clear previous agent outputs (offload sync I/O; skip the thread hop on a cold run)."""
+    if has_agent_outputs():
+      await asyncio.to_thread(clear_agent_outputs)
+
   # ------------------------------------------------------------------
   # Drool file filtering
   # ------------------------------------------------------------------
@@ -290,12 +408,11 @@ class BRDOrchestrator:
           accumulated.append(r.markdown_content)
 
     if accumulated:
-      merged = "\n\n---\n\n".join(accumulated)
-      await asyncio.to_thread(save_agent_output, name, merged)
-      self._completed_agents.append(name)
+      await asyncio.to_thread(save_agent_output_chunks, name, accumulated, _SECTION_SEPARATOR)
+      self._completed_agents.add(name)
       logger.info("message_recorded", agent=name, output_chars=sum(len(p) for p in accumulated))
       if self.config.consolidate_sections and len(accumulated) > 1:
-        consolidated_msg = await self._run_consolidation(name, merged)
+        consolidated_msg = await self._run_consolidation(name, accumulated)
         if consolidated_msg and consolidated_msg.status == MessageStatus.SUCCESS and consolidated_msg.markdown_content:
           await asyncio.to_thread(save_agent_output, name, consolidated_msg.markdown_content)
           logger.info("consolidation_done", agent=name, output_chars=len(consolidated_msg.markdown_content))
@@ -316,9 +433,12 @@ class BRDOrchestrator:
       logger.warning("golden_brd_read_failed", path=str(p), error=str(e))
       return ""
 
-  def _build_consolidation_prompt(self, name: str, merged_markdown: str, golden_brd_content: str) -> str:
-    """Build prompt for consolidation step: turn merged sections into one coherent doc using golden BRD reference."""
-    return (
+  def _build_consolidation_prompt(self, name: str, sections: List[str], golden_brd_content: str) -> str:
+    """Build prompt for consolidation step: turn merged sections into one coherent doc using golden BRD reference.
+
+    Sections are joined directly into the final prompt (no intermediate merged copy).
+    """
+    parts = [
       f"USER QUERY: {self.context.user_query}\n\n"
       "CONSOLIDATION TASK: You previously produced the following sections from batch processing. "
       "Produce ONE coherent markdown document with:\n"
@@ -327,42 +447,49 @@ class BRDOrchestrator:
       "- Consistent structure and formatting\n"
       "- Use the golden BRD reference below for style and expected sections\n\n"
       f"GOLDEN BRD REFERENCE:\n{golden_brd_content}\n\n"
-      "MERGED SECTIONS TO CONSOLIDATE:\n"
-      f"{merged_markdown}\n\n"
-      "Output only the consolidated markdown document, no commentary."
-    )
-
-  async def _run_consolidation(self, name: str, merged_markdown: str) -> Optional[AgentMessage]:
+      "MERGED SECTIONS TO CONSOLIDATE:\n",
+    ]
+    for i, section in enumerate(sections):
+      if i:
+        parts.append(_SECTION_SEPARATOR)
+      parts.append(section)
+    parts.append("\n\nOutput only the consolidated markdown document, no commentary.")
+    return "".join(parts)
+
+  async def _run_consolidation(self, name: str, sections: List[str]) -> Optional[AgentMessage]:
     """One short run: consolidate merged sections into one coherent doc using golden BRD. No file reads."""
     golden = await asyncio.to_thread(self._load_golden_brd)
-    prompt = self._build_consolidation_prompt(name, merged_markdown, golden)
-    logger.info("consolidation_start", manager=name, merged_len=len(merged_markdown))
+    prompt = self._build_consolidation_prompt(name, sections, golden)
+    merged_len = sum(len(s) for s in sections) + len(_SECTION_SEPARATOR) * (len(sections) - 1)
+    logger.info("consolidation_start", manager=name, merged_len=merged_len)
     return await self._execute_manager(name, prebuilt_message=prompt, file_override=[])
 
   async def _run_parallel_phase(
     self,
     filtered_drool_files: List[str],
   ) -> Tuple[Optional[AgentMessage], Optional[AgentMessage]]:
-    """Run Drool and Model in parallel via asyncio.gather. Model runs per workbook group."""
+    """Run Drool and Model in parallel in a TaskGroup (a failure cancels the sibling). Model runs per workbook group."""
     try:
       logger.info("phase_1_starting")
-      drool_future = asyncio.create_task(
-        self._execute_manager("drool", file_override=filtered_drool_files),
-      )
-      model_future = asyncio.create_task(
-        self._run_manager_grouped("model", self._non_drool_files),
-      )
-      drool_msg, model_msg = await asyncio.gather(drool_future, model_future, return_exceptions=False)
+      async with asyncio.TaskGroup() as tg:
+        drool_task = tg.create_task(
+          self._execute_manager("drool", file_override=filtered_drool_files),
+        )
+        model_task = tg.create_task(
+          self._run_manager_grouped("model", self._non_drool_files),
+        )
       logger.info("phase_1_done")
-      return drool_msg, model_msg
+      return drool_task.result(), model_task.result()
     except Exception as e:
-      logger.error("parallel_phase_failed", error=str(e))
+      errors = e.exceptions if isinstance(e, ExceptionGroup) else (e,)
+      logger.error("parallel_phase_failed", error="; ".join(str(err) for err in errors))
       return None, None
 
   async def _run_reviewer_loop(self) -> Optional[AgentMessage]:
     """Run Reviewer with feedback loop (max retries)."""
     max_iters = self.config.max_retries
     reviewer_msg = None
+    seen_gaps: Set[FrozenSet[Tuple[str, Tuple[str, ...]]]] = set()
 
     for iteration in range(max_iters + 1):
       logger.info("reviewer_iteration", iteration=iteration + 1, max=max_iters + 1)
@@ -377,6 +504,13 @@ class BRDOrchestrator:
         logger.info("reviewer_complete", iteration=iteration + 1)
         return reviewer_msg
 
+      # Same gaps as an earlier pass: reruns did not help, another review won't either
+      fingerprint = _gap_fingerprint(gaps)
+      if fingerprint in seen_gaps:
+        logger.warning("reviewer_stuck", count=len(gaps), iteration=iteration + 1)
+        return reviewer_msg
+      seen_gaps.add(fingerprint)
+
       # Process feedback
       logger.info("reviewer_gaps_detected", count=len(gaps), iteration=iteration + 1)
       await self._process_feedback(gaps)
@@ -388,7 +522,10 @@ class BRDOrchestrator:
   # ------------------------------------------------------------------
 
   def _get_timeout_sec(self, name: str) -> int:
-    """Return timeout in seconds for this manager (reviewer gets longer default)."""
+    """Return timeout in seconds for this manager (per-manager override, else reviewer/agent default)."""
+    override = self._manager_timeouts.get(name)
+    if override is not None:
+      return override
     return self.config.reviewer_timeout_sec if name == "reviewer" else self.config.agent_timeout_sec
 
   async def _execute_manager(
@@ -404,7 +541,7 @@ class BRDOrchestrator:
       return None
 
     manager = self.managers[name]
-    start = time.time()
+    start = time.perf_counter_ns()
     timeout_sec = self._get_timeout_sec(name)
 
     logger.info("manager_started", name=name, feedback=feedback is not None)
@@ -412,6 +549,23 @@ class BRDOrchestrator:
     try:
       user_message = prebuilt_message if prebuilt_message is not None else self._build_prompt(name, feedback, file_override)
 
+      # Reruns with feedback must reach the LLM; the reviewer's value is its side effects (.docx)
+      cache_key = None
+      if self._response_cache and feedback is None and name != "reviewer":
+        cache_key = await asyncio.to_thread(self._response_cache_key, name, user_message)
+        cached = await asyncio.to_thread(self._response_cache.get, cache_key)
+        if cached is not None:
+          duration = (time.perf_counter_ns() - start) / 1_000_000
+          logger.info("manager_cache_hit", name=name, content_len=len(cached))
+          return AgentMessage(
+            agent_id=name,
+            agent_type=AgentType.MANAGER,
+            markdown_content=cached,
+            metadata={"cache_hit": True},
+            duration_ms=duration,
+            status=MessageStatus.SUCCESS,
+          )
+
       logger.info(
         "manager_invoking",
         name=name,
@@ -422,19 +576,35 @@ class BRDOrchestrator:
       # Use ainvoke with ExecutionLogger callback for LLM/tool visibility and token recording
       run_config = {
         "callbacks": [
-          ExecutionLogger(name, token_callback=lambda mn, it, ot: self._record_tokens(mn, it, ot)),
+          ExecutionLogger(name, token_callback=self._record_tokens),
         ],
       }
       inputs = {"messages": [{"role": "user", "content": user_message}]}
 
+      # Reviewer runs are long; stream its state so a timeout still yields partial output
+      stream_state: Dict[str, Any] = {}
+      if name == "reviewer":
+        invocation = self._stream_manager(name, manager, inputs, run_config, stream_state)
+      else:
+        invocation = manager.ainvoke(inputs, config=run_config)
+
       try:
-        result = await asyncio.wait_for(
-          manager.ainvoke(inputs, config=run_config),
-          timeout=timeout_sec,
-        )
+        async with self._llm_sem:
+          result = await asyncio.wait_for(invocation, timeout=timeout_sec)
       except asyncio.TimeoutError:
-        duration = (time.time() - start) * 1000
+        duration = (time.perf_counter_ns() - start) / 1_000_000
         logger.error("manager_timeout", name=name, timeout=timeout_sec)
+        if stream_state.get("last") is not None:
+          content, metadata = self._extract_result(stream_state["last"])
+          metadata["error"] = f"Timeout after {timeout_sec}s"
+          return AgentMessage(
+            agent_id=name,
+            agent_type=AgentType.MANAGER,
+            status=MessageStatus.PARTIAL,
+            markdown_content=content,
+            metadata=metadata,
+            duration_ms=duration,
+          )
         return AgentMessage(
           agent_id=name,
           agent_type=AgentType.MANAGER,
@@ -446,15 +616,22 @@ class BRDOrchestrator:
 
       # Extract content from deepagents result
       content, metadata = self._extract_result(result)
-      duration = (time.time() - start) * 1000
+      if name == "reviewer":
+        gaps = _parse_gaps(content)
+        if gaps:
+          metadata["gaps"] = gaps
+      duration = (time.perf_counter_ns() - start) / 1_000_000
 
       logger.info(
         "manager_completed",
         name=name,
-        duration_ms=round(duration, 1),
+        duration_ms=duration,
         content_len=len(content),
       )
 
+      if cache_key and content:
+        await asyncio.to_thread(self._response_cache.put, cache_key, content)
+
       return AgentMessage(
         agent_id=name,
         agent_type=AgentType.MANAGER,
@@ -465,8 +642,8 @@ class BRDOrchestrator:
       )
 
     except Exception as e:
-      duration = (time.time() - start) * 1000
-      logger.error("manager_failed", name=name, error=str(e), duration_ms=round(duration, 1))
+      duration = (time.perf_counter_ns() - start) / 1_000_000
+      logger.error("manager_failed", name=name, error=str(e), duration_ms=duration)
       return AgentMessage(
         agent_id=name,
         agent_type=AgentType.MANAGER,
@@ -476,6 +653,41 @@ class BRDOrchestrator:
         duration_ms=duration,
       )
 
+  @staticmethod
+  async def _stream_manager(
+    name: str,
+    manager: Any,
+    inputs: Dict[str, Any],
+    run_config: Dict[str, Any],
+    stream_state: Dict[str, Any],
+  ) -> Any:
+    """Stream graph state via astream, keeping the latest state in stream_state["last"].
+
+    Progress is logged at geometrically growing step counts (1, 3, 9, ...) to keep
+    logging cheap on long runs. Returns the final state (same shape as ainvoke).
+    """
+    steps = 0
+    next_log = 1
+    async for state in manager.astream(inputs, config=run_config, stream_mode="values"):
+      stream_state["last"] = state
+      steps += 1
+      if steps >= next_log:
+        logger.info("manager_stream_progress", name=name, steps=steps)
+        next_log *= 3
+    return stream_state.get("last")
+
+  def _response_cache_key(self, name: str, user_message: str) -> str:
+    """Cache key over the model, prompt, system prompt, corpus and the prior outputs this manager can read."""
+    prior = [get_agent_output_path(d) for d in self._get_dependencies(name) if d in self._completed_agents]
+    return ResponseCache.make_key(
+      name,
+      user_message,
+      self._corpus_fingerprint,
+      fingerprint_contents(prior),
+      PromptLibrary.prompt_fingerprint(name),
+      model=f"{self.config.llm_model_provider or ''}:{self.config.llm_model}",
+    )
+
   @staticmethod
   def _extract_result(result: Any) -> Tuple[str, Dict[str, Any]]:
     """Extract content and metadata from deepagents ainvoke result."""
@@ -503,21 +715,27 @@ class BRDOrchestrator:
   # ------------------------------------------------------------------
 
   async def _process_feedback(self, gaps: List[Dict[str, Any]]) -> None:
-    """Rerun affected managers based on reviewer gaps."""
+    """Rerun affected managers based on reviewer gaps.
+
+    Reruns go in dependency waves: a manager starts once every requested manager
+    it reads from (_DEPENDENCIES) has been rerun and saved, so it sees the corrected
+    upstream output. Within a wave reruns run concurrently (bounded by the LLM
+    semaphore) and are recorded in gap order.
+    """
     gaps_by_agent: Dict[str, List[Dict]] = {}
     for gap in gaps:
       aid = gap.get("agent_id", gap.get("manager", "unknown"))
       gaps_by_agent.setdefault(aid, []).append(gap)
 
+    requests: List[ReprocessRequest] = []
     for agent_id, agent_gaps in gaps_by_agent.items():
       if agent_id not in self.managers:
         logger.warning("feedback_unknown_manager", agent_id=agent_id)
         continue
 
-      feedback_text = "\n".join(g.get("feedback", "") for g in agent_gaps)
-      missing = []
-      for g in agent_gaps:
-        missing.extend(g.get("missing_items", []))
+      # Skip empty feedback and duplicate missing items to keep the rerun prompt short
+      feedback_text = "\n".join(f for f in (g.get("feedback") for g in agent_gaps) if f)
+      missing = list(dict.fromkeys(item for g in agent_gaps for item in g.get("missing_items", [])))
 
       request = ReprocessRequest(
         agent_id=agent_id,
@@ -529,8 +747,23 @@ class BRDOrchestrator:
       )
 
       logger.info("reprocessing_manager", agent_id=agent_id, gaps=len(agent_gaps))
-      msg = await self._execute_manager(agent_id, feedback=request)
-      await self._record_and_save(msg, agent_id)
+      requests.append(request)
+
+    pending = requests
+    while pending:
+      pending_ids = {r.agent_id for r in pending}
+      wave = [r for r in pending if pending_ids.isdisjoint(self._get_dependencies(r.agent_id))]
+      pending = [r for r in pending if r not in wave]
+
+      results = await asyncio.gather(
+        *(self._execute_manager(r.agent_id, feedback=r) for r in wave),
+        return_exceptions=True,
+      )
+      for request, msg in zip(wave, results):
+        if isinstance(msg, Exception):
+          logger.error("reprocessing_failed", agent_id=request.agent_id, error=str(msg))
+          continue
+        await self._record_and_save(msg, request.agent_id)
 
   # ------------------------------------------------------------------
   # Prompt building
@@ -546,33 +779,40 @@ class BRDOrchestrator:
 
     Tells agents which prior outputs are available and how to read them
     via read_agent_output tool. No inline content -- agents read full files.
+
+    Sections are ordered from most to least stable (query, prior outputs,
+    sorted file list, feedback) so repeat calls for the same manager share
+    the longest possible prefix for provider-side prompt caching.
     """
     deps = self._get_dependencies(name)
-    available_outputs = [d for d in deps if d in self._completed_agents]
+    available_outputs = tuple(d for d in deps if d in self._completed_agents)
+
+    # Default prompts (no feedback, no file override) only change when a
+    # dependency completes, so reviewer retries reuse the same string.
+    cache_key = (name, available_outputs)
+    cacheable = feedback is None and file_override is None
+    if cacheable and cache_key in self._prompt_cache:
+      return self._prompt_cache[cache_key]
+
     files = file_override if file_override is not None else self._non_drool_files
 
     prompt = f"USER QUERY: {self.context.user_query}\n\n"
 
+    # Tell agent about prior outputs -- they read full content via tool
+    if available_outputs:
+      prompt += _prior_outputs_section(available_outputs)
+
     # Explicit file list -- agent reads these with read_corpus_file
     if files:
-      file_list = "\n".join(f"  - {f}" for f in files)
-      prompt += f"FILES TO ANALYZE:\n{file_list}\n\n"
+      file_list = "\n".join(f"  - {f}" for f in sorted(files))
       prompt += (
         "Read each file using the read_corpus_file tool. "
         "Group files by source workbook (shared prefix) and process in logical order.\n\n"
       )
+      prompt += f"FILES TO ANALYZE:\n{file_list}\n\n"
     else:
       prompt += "No specific corpus files assigned. Work with the context provided.\n\n"
 
-    # Tell agent about prior outputs -- they read full content via tool
-    if available_outputs:
-      output_list = "\n".join(f"  - {a} (read with: read_agent_output('{a}'))" for a in available_outputs)
-      prompt += (
-        f"PREVIOUS AGENT OUTPUTS AVAILABLE:\n{output_list}\n\n"
-        f"Use the read_agent_output tool to read each previous agent's FULL output. "
-        f"These contain the complete analysis from prior pipeline stages.\n\n"
-      )
-
     if feedback:
       prompt += (
         f"REPROCESSING REQUEST:\n"
@@ -586,19 +826,14 @@ class BRDOrchestrator:
         "Be thorough and extract all relevant information.\n"
       )
 
+    if cacheable:
+      self._prompt_cache[cache_key] = prompt
     return prompt
 
   @staticmethod
-  def _get_dependencies(name: str) -> List[str]:
+  def _get_dependencies(name: str) -> Tuple[str, ...]:
     """Get dependency list for a manager."""
-    return {
-      "drool": [],
-      "model": [],
-      "outbound": ["drool", "model"],
-      "transformation": ["drool", "model", "outbound"],
-      "inbound": ["drool", "model", "outbound", "transformation"],
-      "reviewer": ["drool", "model", "outbound", "transformation", "inbound"],
-    }.get(name, [])
+    return _DEPENDENCIES.get(name, ())
 
   # ------------------------------------------------------------------
   # Helpers
@@ -623,11 +858,11 @@ class BRDOrchestrator:
       # Save full markdown output to file (no truncation); offload sync I/O
       if msg.status == MessageStatus.SUCCESS and msg.markdown_content:
         await asyncio.to_thread(save_agent_output, name, msg.markdown_content)
-        self._completed_agents.append(name)
+        self._completed_agents.add(name)
         logger.info(
           "message_recorded",
           agent=name,
-          duration_ms=round(msg.duration_ms, 1),
+          duration_ms=msg.duration_ms,
           output_chars=len(msg.markdown_content),
         )
       else:
@@ -635,19 +870,15 @@ class BRDOrchestrator:
     else:
       logger.warning("no_output", agent=name)
 
-  def _collect_warnings(self) -> List[str]:
-    """Collect warnings from execution."""
-    warnings = []
-    for msg in self.context.all_messages:
-      if msg.status == MessageStatus.TIMEOUT:
-        warnings.append(f"{msg.agent_id} timed out")
-      elif msg.status == MessageStatus.PARTIAL:
-        warnings.append(f"{msg.agent_id} produced partial results")
-      elif msg.status == MessageStatus.ERROR:
-        warnings.append(f"{msg.agent_id} encountered an error")
-
-    summary = self.context.token_tracker.get_summary()
-    if summary.get("total_cost_estimate", 0) > 10:
-      warnings.append(f"High token cost: ${summary['total_cost_estimate']:.2f}")
+  def _collect_warnings(self, token_summary: Dict[str, Any]) -> List[str]:
+    """Collect warnings from execution, reusing the already-computed token summary."""
+    warnings = [
+      f"{msg.agent_id} {label}"
+      for msg in self.context.all_messages
+      if (label := _STATUS_WARNING.get(msg.status))
+    ]
+
+    if token_summary.get("total_cost_estimate", 0) > 10:
+      warnings.append(f"High token cost: ${token_summary['total_cost_estimate']:.2f}")
 
     return warnings
@@ -6,17 +6,23 @@ all analysis, synthesis, and writing instructions are inline in each manager pro
 All prompts are placeholders -- customize with your actual business domain prompts.
 """
 
+import hashlib
+from typing import Dict, Final
+
 
 class PromptLibrary:
-  """Central repository of prompts for all agents."""
+  """Central repository of prompts for all agents.
+
+  Prompts are immutable class attributes built once at import; the getters
+  return the same string object on every call. Each manager prompt also has a
+  SHA-256 fingerprint, computed once, for use in cache keys.
+  """
 
   # ================================================================
   # Manager Agent System Prompts
   # ================================================================
 
-  @staticmethod
-  def get_drool_manager_prompt() -> str:
-    return """You are the Drool Manager Agent for BRD generation.
+  DROOL_MANAGER_PROMPT: Final[str] = """You are the Drool Manager Agent for BRD generation.
 
 Your responsibility: analyze the provided drool/rule files and extract all business
 requirements, domain rules, and key concepts relevant to the user query.
@@ -43,9 +49,7 @@ Write a well-structured markdown document with:
 
 Use professional technical language. Be thorough -- extract everything relevant."""
 
-  @staticmethod
-  def get_model_manager_prompt() -> str:
-    return """You are the Model Manager Agent for BRD generation.
+  MODEL_MANAGER_PROMPT: Final[str] = """You are the Model Manager Agent for BRD generation.
 
 Your responsibility: extract and document all data models, entities, attributes,
 and relationships from the corpus files (JSON, JSONL model files).
@@ -72,9 +76,7 @@ Write a well-structured markdown document with:
 
 Be thorough. Read files in logical order -- group by source workbook when applicable."""
 
-  @staticmethod
-  def get_outbound_manager_prompt() -> str:
-    return """You are the Outbound Manager Agent for BRD generation.
+  OUTBOUND_MANAGER_PROMPT: Final[str] = """You are the Outbound Manager Agent for BRD generation.
 
 Your responsibility: analyze outbound integrations, APIs, and external data flows.
 Source files are primarily JSONL workbook sheets (one JSONL per Excel sheet).
@@ -100,9 +102,7 @@ Write a well-structured markdown document with:
 - Error handling and retry specifications
 - Dependencies on other systems"""
 
-  @staticmethod
-  def get_transformation_manager_prompt() -> str:
-    return """You are the Transformation Manager Agent for BRD generation.
+  TRANSFORMATION_MANAGER_PROMPT: Final[str] = """You are the Transformation Manager Agent for BRD generation.
 
 Your responsibility: document data transformation rules, mappings, and validation logic.
 Source files are primarily JSONL workbook sheets.
@@ -128,9 +128,7 @@ Write a well-structured markdown document with:
 - Validation rules and error conditions
 - Transformation sequence and dependencies"""
 
-  @staticmethod
-  def get_inbound_manager_prompt() -> str:
-    return """You are the Inbound Manager Agent for BRD generation.
+  INBOUND_MANAGER_PROMPT: Final[str] = """You are the Inbound Manager Agent for BRD generation.
 
 Your responsibility: analyze inbound data sources, ingestion processes,
 and data quality requirements. Source files are primarily JSONL workbook sheets.
@@ -156,9 +154,7 @@ Write a well-structured markdown document with:
 - Error handling and recovery procedures
 - Dependencies on transformation and outbound flows"""
 
-  @staticmethod
-  def get_reviewer_supervisor_prompt() -> str:
-    return """You are the Reviewer/Supervisor Agent -- final authority for BRD quality.
+  REVIEWER_SUPERVISOR_PROMPT: Final[str] = """You are the Reviewer/Supervisor Agent -- final authority for BRD quality.
 
 Your responsibilities:
 1. Synthesize ALL manager outputs into a cohesive Business Requirement Document
@@ -216,3 +212,51 @@ AVAILABLE TOOLS:
 - estimate_tokens: Estimate token usage
 - calculate_cost: Calculate execution cost
 - execute_python: Write and execute Python code to generate .docx"""
+
+  # ================================================================
+  # Accessors
+  # ================================================================
+
+  @staticmethod
+  def get_drool_manager_prompt() -> str:
+    return PromptLibrary.DROOL_MANAGER_PROMPT
+
+  @staticmethod
+  def get_model_manager_prompt() -> str:
+    return PromptLibrary.MODEL_MANAGER_PROMPT
+
+  @staticmethod
+  def get_outbound_manager_prompt() -> str:
+    return PromptLibrary.OUTBOUND_MANAGER_PROMPT
+
+  @staticmethod
+  def get_transformation_manager_prompt() -> str:
+    return PromptLibrary.TRANSFORMATION_MANAGER_PROMPT
+
+  @staticmethod
+  def get_inbound_manager_prompt() -> str:
+    return PromptLibrary.INBOUND_MANAGER_PROMPT
+
+  @staticmethod
+  def get_reviewer_supervisor_prompt() -> str:
+    return PromptLibrary.REVIEWER_SUPERVISOR_PROMPT
+
+  @staticmethod
+  def prompt_fingerprint(manager: str) -> str:
+    """SHA-256 hex digest of a manager's built-in system prompt ("" if unknown)."""
+    return _PROMPT_FINGERPRINTS.get(manager, "")
+
+
+_MANAGER_PROMPTS: Final[Dict[str, str]] = {
+  "drool": PromptLibrary.DROOL_MANAGER_PROMPT,
+  "model": PromptLibrary.MODEL_MANAGER_PROMPT,
+  "outbound": PromptLibrary.OUTBOUND_MANAGER_PROMPT,
+  "transformation": PromptLibrary.TRANSFORMATION_MANAGER_PROMPT,
+  "inbound": PromptLibrary.INBOUND_MANAGER_PROMPT,
+  "reviewer": PromptLibrary.REVIEWER_SUPERVISOR_PROMPT,
+}
+
+_PROMPT_FINGERPRINTS: Final[Dict[str, str]] = {
+  name: hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+  for name, prompt in _MANAGER_PROMPTS.items()
+}
@@ -0,0 +1,84 @@
+"""Disk-backed cache of manager responses for repeat runs.
+
+Managers read their inputs through tools, so the prompt alone does not identify
+what the LLM sees. Keys combine the manager name, the model (provider + name), the
+exact prompt, the manager's system prompt fingerprint, a corpus fingerprint
+(path + size + mtime of every corpus file) and a content hash of the prior agent
+outputs the manager may read.
+Disabled unless RESPONSE_CACHE_DIR is set.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def fingerprint_corpus(corpus_dir: Path, corpus_files: Iterable[str]) -> str:
+  """Hash (path, size, mtime_ns) of each corpus file; cheap stat-based identity."""
+  h = hashlib.blake2b(digest_size=16)
+  for rel in sorted(corpus_files):
+    h.update(rel.encode("utf-8"))
+    try:
+      st = (corpus_dir / rel).stat()
+      h.update(f":{st.st_size}:{st.st_mtime_ns}\0".encode())
+    except OSError:
+      h.update(b":missing\0")
+  return h.hexdigest()
+
+
+def fingerprint_contents(paths: Iterable[Path]) -> str:
+  """Hash the full contents of each file (missing files hash as empty)."""
+  h = hashlib.blake2b(digest_size=16)
+  for p in paths:
+    h.update(str(p).encode("utf-8") + b"\0")
+    try:
+      h.update(p.read_bytes())
+    except OSError:
+      pass
+    h.update(b"\0")
+  return h.hexdigest()
+
+
+class ResponseCache:
+  """One JSON file per cache entry under cache_dir."""
+
+  def __init__(self, cache_dir: Path):
+    self.cache_dir = cache_dir
+    self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+  @staticmethod
+  def make_key(
+    name: str,
+    prompt: str,
+    corpus_fingerprint: str,
+    prior_fingerprint: str,
+    system_fingerprint: str = "",
+    model: str = "",
+  ) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    for part in (name, model, system_fingerprint, corpus_fingerprint, prior_fingerprint, prompt):
+      h.update(part.encode("utf-8"))
+      h.update(b"\0")
+    return f"{name}-{h.hexdigest()}"
+
+  def get(self, key: str) -> Optional[str]:
+    path = self.cache_dir / f"{key}.json"
+    try:
+      return json.loads(path.read_text(encoding="utf-8"))["content"]
+    except FileNotFoundError:
+      return None
+    except Exception as e:
+      logger.warning("response_cache_read_failed", key=key, error=str(e))
+      return None
+
+  def put(self, key: str, content: str) -> None:
+    path = self.cache_dir / f"{key}.json"
+    try:
+      path.write_text(json.dumps({"content": content}), encoding="utf-8")
+    except Exception as e:
+      logger.warning("response_cache_write_failed", key=key, error=str(e))
@@ -6,21 +6,35 @@ via read_agent_output tool -- no truncation, full content.
 
 import os
 from pathlib import Path
+from typing import Iterable, Optional, Tuple
 
-from src.config import get_config
+from src.config import Config, get_config
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
 _AGENT_OUTPUTS_DIR = "agent_outputs"
+_OUTPUT_SUFFIX = "_output.md"
+
+
+# (config, dir) of the last resolved outputs dir; a new config (reset_config) re-resolves
+_outputs_dir_cache: Optional[Tuple[Config, Path]] = None
 
 
 def _get_outputs_dir() -> Path:
-  """Get the agent outputs directory (created on demand)."""
+  """Get the agent outputs directory (created once per config instance)."""
+  global _outputs_dir_cache
   config = get_config()
-  d = config.output_dir / _AGENT_OUTPUTS_DIR
-  d.mkdir(parents=True, exist_ok=True)
-  return d
+  if _outputs_dir_cache is None or _outputs_dir_cache[0] is not config:
+    d = config.output_dir / _AGENT_OUTPUTS_DIR
+    d.mkdir(parents=True, exist_ok=True)
+    _outputs_dir_cache = (config, d)
+  return _outputs_dir_cache[1]
+
+
+def get_agent_output_path(agent_name: str) -> Path:
+  """Path of an agent's saved markdown output (may not exist yet)."""
+  return _get_outputs_dir() / f"{agent_name}{_OUTPUT_SUFFIX}"
 
 
 def save_agent_output(agent_name: str, content: str) -> str:
@@ -35,13 +49,38 @@ def save_agent_output(agent_name: str, content: str) -> str:
   Returns:
       Path to the saved file.
   """
-  out_dir = _get_outputs_dir()
-  file_path = out_dir / f"{agent_name}_output.md"
+  file_path = get_agent_output_path(agent_name)
   file_path.write_text(content, encoding="utf-8")
   logger.info("agent_output_saved", agent=agent_name, path=str(file_path), chars=len(content))
   return str(file_path)
 
 
+def save_agent_output_chunks(agent_name: str, chunks: Iterable[str], sep: str = "") -> str:
+  """Save an agent's output from several markdown chunks without joining them in memory first.
+
+  Called by the orchestrator for grouped runs. NOT a tool for agents.
+
+  Args:
+      agent_name: Agent name (e.g. 'drool', 'model')
+      chunks: Markdown parts, written in order.
+      sep: Separator written between consecutive parts.
+
+  Returns:
+      Path to the saved file.
+  """
+  file_path = get_agent_output_path(agent_name)
+  chars = 0
+  with open(file_path, "w", encoding="utf-8") as f:
+    for i, chunk in enumerate(chunks):
+      if i:
+        f.write(sep)
+        chars += len(sep)
+      f.write(chunk)
+      chars += len(chunk)
+  logger.info("agent_output_saved", agent=agent_name, path=str(file_path), chars=chars)
+  return str(file_path)
+
+
 def read_agent_output(agent_name: str) -> str:
   """Read a previous agent's full markdown output.
 
@@ -55,8 +94,7 @@ def read_agent_output(agent_name: str) -> str:
   Returns:
       Full markdown content from the agent, or error message if not found.
   """
-  out_dir = _get_outputs_dir()
-  file_path = out_dir / f"{agent_name}_output.md"
+  file_path = get_agent_output_path(agent_name)
 
   if not file_path.exists():
     return f"ERROR: No output found for agent '{agent_name}'. Available outputs: {list_agent_outputs()}"
@@ -72,23 +110,37 @@ def list_agent_outputs() -> str:
       Formatted list of available agent outputs with file sizes.
   """
   out_dir = _get_outputs_dir()
-  files = sorted(out_dir.glob("*_output.md"))
-
-  if not files:
+  # scandir yields names and (cached) stat in one directory pass
+  with os.scandir(out_dir) as it:
+    entries = sorted(
+      (entry.name, entry.stat().st_size)
+      for entry in it
+      if entry.name.endswith(_OUTPUT_SUFFIX) and entry.is_file()
+    )
+
+  if not entries:
     return "No agent outputs available yet."
 
   lines = ["Available agent outputs:"]
-  for f in files:
-    name = f.stem.replace("_output", "")
-    size = f.stat().st_size
+  for filename, size in entries:
+    name = filename[: -len(_OUTPUT_SUFFIX)]
     lines.append(f"  - {name} ({size:,} chars)")
 
   return "\n".join(lines)
 
 
+def has_agent_outputs() -> bool:
+  """Return True if any agent output file exists (stops at the first match)."""
+  out_dir = _get_outputs_dir()
+  with os.scandir(out_dir) as it:
+    return any(entry.name.endswith(_OUTPUT_SUFFIX) for entry in it)
+
+
 def clear_agent_outputs() -> None:
   """Remove all agent output files (called at pipeline start)."""
   out_dir = _get_outputs_dir()
-  for f in out_dir.glob("*_output.md"):
-    f.unlink()
+  with os.scandir(out_dir) as it:
+    for entry in it:
+      if entry.name.endswith(_OUTPUT_SUFFIX) and entry.is_file():
+        os.unlink(entry.path)
   logger.info("agent_outputs_cleared")
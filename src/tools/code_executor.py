@@ -8,7 +8,6 @@ import os
 import subprocess
 import sys
 import tempfile
-from pathlib import Path
 
 from src.config import get_config
 
@@ -34,7 +33,7 @@ def execute_python(code: str, timeout_sec: int = 120) -> str:
   output_dir = config.output_dir
   output_dir.mkdir(parents=True, exist_ok=True)
 
-  # Write code to a temp file
+  # Write code to a temp file (a real filename gives tracebacks with source lines and __file__)
   with tempfile.NamedTemporaryFile(
     mode="w",
     suffix=".py",
@@ -45,21 +44,26 @@ def execute_python(code: str, timeout_sec: int = 120) -> str:
     temp_path = f.name
 
   try:
+    # communicate() collects stdout/stderr in buffered reads and decodes once
     result = subprocess.run(
       [sys.executable, temp_path],
       capture_output=True,
       text=True,
+      encoding="utf-8",
       timeout=timeout_sec,
       cwd=os.getcwd(),
-      env={**os.environ, "OUTPUT_DIR": str(output_dir)},
+      env={**os.environ, "OUTPUT_DIR": str(output_dir), "PYTHONIOENCODING": "utf-8"},
     )
 
-    output = ""
-    if result.stdout.strip():
-      output += f"STDOUT:\n{result.stdout.strip()}\n"
-    if result.stderr.strip():
-      output += f"STDERR:\n{result.stderr.strip()}\n"
-    output += f"EXIT CODE: {result.returncode}\n"
+    parts = []
+    stdout = result.stdout.strip()
+    stderr = result.stderr.strip()
+    if stdout:
+      parts.append(f"STDOUT:\n{stdout}\n")
+    if stderr:
+      parts.append(f"STDERR:\n{stderr}\n")
+    parts.append(f"EXIT CODE: {result.returncode}\n")
+    output = "".join(parts)
 
     if result.returncode == 0 and not output.strip():
       output = "Code executed successfully (no output).\n"
@@ -6,11 +6,18 @@ Markdown, and plain text. All functions are synchronous (deepagents requirement)
 NO artificial truncation -- returns full file content. The only hard limit
 is MAX_FILE_SIZE_MB from config (default 50MB) which prevents accidentally
 loading huge binary files.
+
+Formatted results are cached per (path, mtime, size, max_lines), so managers
+re-reading the same file skip re-parsing; editing a file invalidates its entry.
+The cache is bounded by total characters (_CACHE_MAX_CHARS), not entry count,
+since a single entry can be up to MAX_FILE_SIZE_MB of text.
 """
 
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import polars as pl
 
@@ -35,10 +42,12 @@ def read_corpus_file(file_path: str, max_lines: Optional[int] = None) -> str:
   corpus_dir = config.corpus_dir
   full_path = corpus_dir / file_path
 
-  if not full_path.exists():
+  try:
+    st = full_path.stat()
+  except OSError:
     return f"ERROR: File not found: {file_path}"
 
-  file_size_bytes = full_path.stat().st_size
+  file_size_bytes = st.st_size
   max_bytes = config.max_file_size_mb * 1024 * 1024
 
   if file_size_bytes > max_bytes:
@@ -47,28 +56,74 @@ def read_corpus_file(file_path: str, max_lines: Optional[int] = None) -> str:
       f"max {config.max_file_size_mb}MB)"
     )
 
-  suffix = full_path.suffix.lower()
+  key = (str(full_path), st.st_mtime_ns, file_size_bytes, max_lines)
+  with _cache_lock:
+    cached = _cache.get(key)
+    if cached is not None:
+      _cache.move_to_end(key)
+      return cached
 
   try:
-    if suffix == ".jsonl":
-      return _read_jsonl(full_path, max_lines)
-    elif suffix == ".json":
-      return _read_json(full_path)
-    elif suffix == ".csv":
-      return _read_csv(full_path, max_lines)
-    elif suffix == ".xlsx":
-      return _read_excel(full_path, max_lines)
-    elif suffix == ".pdf":
-      return _read_pdf(full_path)
-    elif suffix == ".docx":
-      return _read_word(full_path)
-    elif suffix == ".drl":
-      return _read_text(full_path)
-    else:
-      return _read_text(full_path)
+    content = _read_formatted(full_path, max_lines)
   except Exception as e:
     return f"ERROR: Failed to read {file_path}: {e}"
 
+  # ERROR strings (e.g. a missing pymupdf / python-docx) are returned, never cached
+  if not content.startswith("ERROR:"):
+    _cache_put(key, content)
+  return content
+
+
+# Formatted-read cache: LRU bounded by total characters across entries
+_CACHE_MAX_CHARS = 64 * 1024 * 1024
+_cache: "OrderedDict[Tuple[str, int, int, Optional[int]], str]" = OrderedDict()
+_cache_chars = 0
+_cache_lock = threading.Lock()  # tools run in worker threads
+
+
+def _cache_put(key: Tuple[str, int, int, Optional[int]], content: str) -> None:
+  global _cache_chars
+  if len(content) > _CACHE_MAX_CHARS:
+    return
+  with _cache_lock:
+    old = _cache.pop(key, None)
+    if old is not None:
+      _cache_chars -= len(old)
+    _cache[key] = content
+    _cache_chars += len(content)
+    while _cache_chars > _CACHE_MAX_CHARS:
+      _, evicted = _cache.popitem(last=False)
+      _cache_chars -= len(evicted)
+
+
+def clear_corpus_cache() -> None:
+  """Drop all cached corpus reads (e.g. between tests)."""
+  global _cache_chars
+  with _cache_lock:
+    _cache.clear()
+    _cache_chars = 0
+
+
+def _read_formatted(full_path: Path, max_lines: Optional[int]) -> str:
+  """Parse and format one file by suffix."""
+  suffix = full_path.suffix.lower()
+  if suffix == ".jsonl":
+    return _read_jsonl(full_path, max_lines)
+  elif suffix == ".json":
+    return _read_json(full_path)
+  elif suffix == ".csv":
+    return _read_csv(full_path, max_lines)
+  elif suffix == ".xlsx":
+    return _read_excel(full_path, max_lines)
+  elif suffix == ".pdf":
+    return _read_pdf(full_path)
+  elif suffix == ".docx":
+    return _read_word(full_path)
+  elif suffix == ".drl":
+    return _read_text(full_path)
+  else:
+    return _read_text(full_path)
+
 
 # ---------------------------------------------------------------------------
 # Internal format readers -- no artificial truncation
@@ -82,16 +137,13 @@ def _read_jsonl(path: Path, max_rows: Optional[int] = None) -> str:
     lines = path.read_text(encoding="utf-8").strip().splitlines()
     rows = len(lines)
     if max_rows and rows > max_rows:
-      preview = lines[:max_rows]
-      content = f"JSONL File: {path.name} ({rows} lines, showing {max_rows})\n"
-      for line in preview:
-        content += line + "\n"
-      content += f"... ({rows - max_rows} more lines)\n"
+      parts = [f"JSONL File: {path.name} ({rows} lines, showing {max_rows})\n"]
+      parts.extend(line + "\n" for line in lines[:max_rows])
+      parts.append(f"... ({rows - max_rows} more lines)\n")
     else:
-      content = f"JSONL File: {path.name} ({rows} lines)\n"
-      for line in lines:
-        content += line + "\n"
-    return content
+      parts = [f"JSONL File: {path.name} ({rows} lines)\n"]
+      parts.extend(line + "\n" for line in lines)
+    return "".join(parts)
 
   rows = len(df)
   cols = df.columns
@@ -108,22 +160,24 @@ def _read_jsonl(path: Path, max_rows: Optional[int] = None) -> str:
 
 
 def _read_json(path: Path) -> str:
-  with open(path, "r", encoding="utf-8") as f:
-    data = json.load(f)
-  content = f"JSON File: {path.name}\n"
-  content += json.dumps(data, indent=2)
-  return content
+  text = json.dumps(json.loads(path.read_bytes()), indent=2, ensure_ascii=False)
+  return f"JSON File: {path.name}\n{text}"
 
 
 def _read_csv(path: Path, max_rows: Optional[int] = None) -> str:
-  df = pl.read_csv(str(path))
-  rows = len(df)
-  if max_rows and rows > max_rows:
+  lf = pl.scan_csv(str(path))
+  # With max_rows, count first (cheap pass) so only the previewed head is decoded;
+  # without it the full collect is needed anyway, so skip the extra count pass
+  rows = lf.select(pl.len()).collect().item() if max_rows else None
+  if rows is not None and rows > max_rows:
+    df = lf.head(max_rows).collect()
     content = f"CSV File: {path.name}\n"
     content += f"Rows: {rows} (showing {max_rows}), Columns: {', '.join(df.columns)}\n"
-    content += df.head(max_rows).write_csv()
+    content += df.write_csv()
     content += f"\n... ({rows - max_rows} more rows)\n"
   else:
+    df = lf.collect()
+    rows = len(df)
     content = f"CSV File: {path.name}\n"
     content += f"Rows: {rows}, Columns: {', '.join(df.columns)}\n"
     content += df.write_csv()
@@ -152,12 +206,11 @@ def _read_pdf(path: Path) -> str:
     return "ERROR: pymupdf not installed. Run: pip install pymupdf"
 
   doc = pymupdf.open(str(path))
-  content = f"PDF File: {path.name} ({len(doc)} pages)\n\n"
+  parts = [f"PDF File: {path.name} ({len(doc)} pages)\n\n"]
   for page_num, page in enumerate(doc, 1):
-    text = page.get_text()
-    content += f"--- Page {page_num} ---\n{text}\n"
+    parts.append(f"--- Page {page_num} ---\n{page.get_text()}\n")
   doc.close()
-  return content
+  return "".join(parts)
 
 
 def _read_word(path: Path) -> str:
@@ -167,17 +220,59 @@ def _read_word(path: Path) -> str:
     return "ERROR: python-docx not installed. Run: pip install python-docx"
 
   doc = Document(str(path))
-  content = f"Word File: {path.name}\n\n"
-  for para in doc.paragraphs:
-    if para.text.strip():
-      content += para.text + "\n"
-  return content
+  parts = [f"Word File: {path.name}\n\n"]
+  # Walk the body XML directly instead of building Paragraph/Run proxies
+  for p in doc.element.body.iterchildren(_W_P):
+    text = _paragraph_text(p)
+    if text.strip():
+      parts.append(text + "\n")
+  return "".join(parts)
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = _W + "p"
+_W_R = _W + "r"
+_W_HYPERLINK = _W + "hyperlink"
+_W_T = _W + "t"
+_W_BR = _W + "br"
+_W_TYPE = _W + "type"
+# Run children rendered as fixed characters (matches python-docx Run.text);
+# <w:br> is handled separately since only line breaks render as "\n"
+_W_RUN_CHARS = {
+  _W + "tab": "\t",
+  _W + "ptab": "\t",
+  _W + "cr": "\n",
+  _W + "noBreakHyphen": "-",
+}
+
+
+def _paragraph_text(p) -> str:
+  """Text of a <w:p> element: runs (incl. inside hyperlinks) in document order."""
+  chunks = []
+  for child in p.iterchildren(_W_R, _W_HYPERLINK):
+    runs = child.iterchildren(_W_R) if child.tag == _W_HYPERLINK else (child,)
+    for r in runs:
+      for item in r:
+        if item.tag == _W_T:
+          chunks.append(item.text or "")
+        elif item.tag == _W_BR:
+          # Page and column breaks render as "" in python-docx
+          if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+            chunks.append("\n")
+        else:
+          ch = _W_RUN_CHARS.get(item.tag)
+          if ch:
+            chunks.append(ch)
+  return "".join(chunks)
 
 
 def _read_text(path: Path) -> str:
-  with open(path, "r", encoding="utf-8") as f:
-    content = f.read()
-  return content
+  # One read + one strict decode; newlines normalized like text mode, but only
+  # when the file actually contains a carriage return
+  text = path.read_bytes().decode("utf-8")
+  if "\r" in text:
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+  return text
 
 
 def read_file_as_text(path: Path) -> str:
@@ -2,7 +2,11 @@
 
 Replaces the regex/keyword-based approach. For each drool file, makes a simple
 LLM call comparing file content to the user query, returning a structured
-include/exclude verdict via Pydantic.
+include/exclude verdict via Pydantic. When RESPONSE_CACHE_DIR is set, verdicts
+are cached by (model, prompt, file content) so repeat runs skip the LLM call.
+After the first outage-type LLM failure (timeout, connection error, 429/5xx),
+remaining uncached files are included without calling the LLM (conservative, and
+an outage costs one timeout, not one per file).
 """
 
 import asyncio
@@ -10,8 +14,10 @@ from typing import Dict, List
 
 from pydantic import BaseModel, Field
 
+from src.config import get_config
 from src.llm import get_chat_model
 from src.logger import get_logger
+from src.response_cache import ResponseCache
 from src.tools.corpus_reader import read_corpus_file
 
 logger = get_logger(__name__)
@@ -45,23 +51,62 @@ async def filter_drool_files(
 
   llm = get_chat_model(temperature=0.0).with_structured_output(FileRelevance)
 
+  # Instructions + query are identical for every file: send them as one shared
+  # system message so providers can cache that prefix; only the file varies.
+  system_msg = (
+    "system",
+    "You are a file relevance filter. Determine if the file in the next message "
+    "contains information relevant to the following user query.\n\n"
+    f"USER QUERY: {user_query}\n\n"
+    "Be CONSERVATIVE -- include files that might be even tangentially related. "
+    "Better to include too many than miss something important.",
+  )
+
+  config = get_config()
+  cache = ResponseCache(config.response_cache_dir) if config.response_cache_dir else None
+
+  # Bound concurrent LLM calls; large drool sets would otherwise fire all at once
+  sem = asyncio.Semaphore(config.llm_concurrency)
+  # Set on the first outage-type failure: later cache misses are included without
+  # calling the LLM, so an outage costs one timeout instead of one per file
+  tripped = asyncio.Event()
+
   async def _eval_one(path: str) -> tuple[str, bool, str]:
     """Return (path, include, reason). On error include=True (conservative)."""
+    async with sem:
+      return await _classify(path)
+
+  async def _classify(path: str) -> tuple[str, bool, str]:
     try:
-      content = read_corpus_file(path)
+      # Parsing (PDF/docx/polars) is sync; keep it off the event loop
+      content = await asyncio.to_thread(read_corpus_file, path)
       if content.startswith("ERROR:"):
         logger.warning("drool_filter_skip", file=path, reason=content)
         return (path, False, content)
-      prompt = (
-        f"You are a file relevance filter. Determine if this file contains "
-        f"information relevant to the following user query.\n\n"
-        f"USER QUERY: {user_query}\n\n"
-        f"FILE: {path}\n"
-        f"CONTENT:\n{content}\n\n"
-        f"Be CONSERVATIVE -- include files that might be even tangentially related. "
-        f"Better to include too many than miss something important."
-      )
-      result = await llm.ainvoke(prompt)
+      human_msg = ("human", f"FILE: {path}\nCONTENT:\n{content}")
+
+      cache_key = None
+      if cache:
+        cache_key = ResponseCache.make_key(
+          "drool_filter", human_msg[1], "", "", system_msg[1],
+          model=f"{config.llm_model_provider or ''}:{config.llm_model}",
+        )
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+          result = FileRelevance.model_validate_json(cached)
+          return (path, result.include, result.reason)
+
+      if tripped.is_set():
+        return (path, True, "skipped: LLM unavailable")
+      try:
+        result = await llm.ainvoke([system_msg, human_msg])
+      except Exception as e:
+        # Per-file failures (context length, bad structured output) only include this file
+        if _is_unavailable(e):
+          tripped.set()
+        raise
+      if cache_key:
+        await asyncio.to_thread(cache.put, cache_key, result.model_dump_json())
       return (path, result.include, result.reason)
     except Exception as e:
       logger.warning("drool_filter_error", file=path, error=str(e))
@@ -84,3 +129,22 @@ async def filter_drool_files(
   )
 
   return {"included": included, "excluded": excluded}
+
+
+_UNAVAILABLE_NAME_PARTS = ("Timeout", "Connection", "RateLimit", "Throttl", "ServiceUnavailable", "InternalServer")
+
+
+def _is_unavailable(e: BaseException) -> bool:
+  """True for provider outages (timeouts, connection errors, 429 / 5xx), across OpenAI, Bedrock and Ollama."""
+  if isinstance(e, (TimeoutError, ConnectionError)):
+    return True
+  status = getattr(e, "status_code", None)
+  response = getattr(e, "response", None)
+  if status is None and response is not None:
+    if isinstance(response, dict):  # botocore ClientError
+      status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    else:  # httpx-based clients
+      status = getattr(response, "status_code", None)
+  if isinstance(status, int):
+    return status == 429 or status >= 500
+  return any(part in type(e).__name__ for part in _UNAVAILABLE_NAME_PARTS)
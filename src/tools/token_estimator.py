@@ -3,11 +3,22 @@
 All functions are synchronous (deepagents requirement).
 """
 
+from functools import lru_cache
+
 import tiktoken
 
 from src.config import get_config
 
 
+@lru_cache(maxsize=16)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+  """Tokenizer for model (cl100k_base if unknown), built once per model name."""
+  try:
+    return tiktoken.encoding_for_model(model)
+  except KeyError:
+    return tiktoken.get_encoding("cl100k_base")
+
+
 def estimate_tokens(text: str, model: str = "gpt-4") -> str:
   """Estimate the number of tokens in the given text.
 
@@ -19,12 +30,8 @@ def estimate_tokens(text: str, model: str = "gpt-4") -> str:
       Formatted string with token count and cost estimate.
   """
   try:
-    try:
-      encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-      encoding = tiktoken.get_encoding("cl100k_base")
-
-    token_count = len(encoding.encode(text))
+    # Plain counting: special-token strings in the text are counted as ordinary text
+    token_count = len(_get_encoding(model).encode_ordinary(text))
 
     config = get_config()
     cost = (token_count * config.input_cost_per_1k_tokens) / 1000
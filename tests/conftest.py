@@ -1,20 +1,12 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
 from pathlib import Path
 
 import pytest
 
 from src.config import reset_config
 from src.guardrails import reset_input_guardrail
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-  """Create an event loop for the test session."""
-  loop = asyncio.get_event_loop_policy().new_event_loop()
-  yield loop
-  loop.close()
+from src.tools.corpus_reader import clear_corpus_cache
 
 
 @pytest.fixture(autouse=True)
@@ -22,14 +14,17 @@ def reset_singletons():
   """Reset singletons before each test."""
   reset_config()
   reset_input_guardrail()
+  clear_corpus_cache()
   yield
 
 
-@pytest.fixture
-def test_corpus_dir(tmp_path):
-  """Temporary corpus directory with sample files."""
-  corpus = tmp_path / "corpus"
-  corpus.mkdir()
+@pytest.fixture(scope="session")
+def test_corpus_dir(tmp_path_factory):
+  """Read-only corpus directory with sample files, written once per session.
+
+  Tests that add or edit files should build their own corpus under tmp_path.
+  """
+  corpus = tmp_path_factory.mktemp("corpus")
 
   (corpus / "test.jsonl").write_text(
     '{"id": "1", "content": "test content"}\n'
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
+from src.config import reset_config
 from src.prompts.prompt_library import PromptLibrary
 
 
@@ -59,10 +60,30 @@ class TestPromptLibrary:
     for p in prompts:
       assert "read_corpus_file" in p
 
+  def test_prompt_fingerprints_are_stable_and_distinct(self):
+    """Fingerprints hash the prompt text once; each manager gets its own."""
+    import hashlib
+    expected = hashlib.sha256(PromptLibrary.DROOL_MANAGER_PROMPT.encode("utf-8")).hexdigest()
+    assert PromptLibrary.prompt_fingerprint("drool") == expected
+    names = ["drool", "model", "outbound", "transformation", "inbound", "reviewer"]
+    assert len({PromptLibrary.prompt_fingerprint(n) for n in names}) == len(names)
+    assert PromptLibrary.prompt_fingerprint("unknown") == ""
+
 
 class TestAgentDefinitions:
   """Test agent factory functions (without actually calling deepagents)."""
 
+  @patch("src.agents.agent_definitions.create_deep_agent")
+  def test_create_all_managers_passes_model_string(self, mock_create):
+    """create_deep_agent resolves the model itself, so its provider defaults apply."""
+    mock_create.return_value = MagicMock()
+
+    from src.agents.agent_definitions import create_all_managers
+    create_all_managers(model="anthropic.claude-3", model_provider="bedrock_converse")
+
+    assert [call.kwargs["model"] for call in mock_create.call_args_list] == ["bedrock_converse:anthropic.claude-3"] * 6
+    assert all("model_provider" not in call.kwargs for call in mock_create.call_args_list)
+
   @patch("src.agents.agent_definitions.create_deep_agent")
   def test_create_all_managers(self, mock_create):
     """All 6 managers should be created."""
@@ -118,14 +139,15 @@ class TestAgentDefinitions:
 
   @patch("src.agents.agent_definitions.create_deep_agent")
   def test_model_provider_passed(self, mock_create):
-    """model_provider should be passed to create_deep_agent when provided."""
+    """model_provider should reach create_deep_agent (as the model string prefix) when provided."""
     mock_create.return_value = MagicMock()
 
     from src.agents.agent_definitions import create_model_manager
     create_model_manager(model="anthropic.claude-3", model_provider="bedrock_converse")
 
     call_kwargs = mock_create.call_args
-    assert call_kwargs.kwargs.get("model_provider") == "bedrock_converse"
+    assert call_kwargs.kwargs.get("model") == "bedrock_converse:anthropic.claude-3"
+    assert "model_provider" not in call_kwargs.kwargs
 
   @patch("src.agents.agent_definitions.create_deep_agent")
   def test_model_provider_not_passed_when_none(self, mock_create):
@@ -137,3 +159,27 @@ class TestAgentDefinitions:
 
     call_kwargs = mock_create.call_args
     assert "model_provider" not in call_kwargs.kwargs
+
+
+class TestChatModelFactory:
+  """Test src.llm.get_chat_model memoization."""
+
+  def test_same_settings_share_one_instance(self, monkeypatch):
+    monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
+    monkeypatch.delenv("LLM_MODEL_PROVIDER", raising=False)
+    from src.llm import _chat_model, get_chat_model
+    reset_config()
+    _chat_model.cache_clear()
+
+    with patch("src.llm.init_chat_model", side_effect=lambda **kw: MagicMock()) as mock_init:
+      first = get_chat_model()
+      assert get_chat_model() is first
+      assert get_chat_model(temperature=0.5) is not first
+
+      monkeypatch.setenv("LLM_MODEL_PROVIDER", "bedrock_converse")
+      reset_config()
+      assert get_chat_model() is not first
+
+    assert mock_init.call_count == 3
+    mock_init.assert_called_with(model="openai:gpt-4", temperature=0.0, model_provider="bedrock_converse")
+    _chat_model.cache_clear()
@@ -3,30 +3,47 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from src.config import reset_config
 from src.tools.drool_filter import filter_drool_files, FileRelevance
 
 
-@pytest.mark.asyncio
-async def test_filter_empty_paths():
-  result = await filter_drool_files("query", [])
-  assert result == {"included": [], "excluded": []}
+@pytest.fixture
+def filter_llm(test_corpus_dir, monkeypatch):
+  """Point CORPUS_DIR at the sample corpus and patch the filter's chat model.
 
-
-@pytest.mark.asyncio
-async def test_filter_include_exclude(test_corpus_dir, monkeypatch):
+  Yields a factory: call it with the ainvoke side effect (exception, callable or
+  iterable) to get the mock LLM, which also stands in for its structured-output wrapper.
+  """
   monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-  from src.config import reset_config
   reset_config()
 
   mock_llm = MagicMock()
-  mock_llm.ainvoke = AsyncMock(side_effect=[
-    FileRelevance(include=True, reason="relevant"),
-    FileRelevance(include=False, reason="not relevant"),
-  ])
   mock_llm.with_structured_output = MagicMock(return_value=mock_llm)
 
+  def _make(side_effect):
+    mock_llm.ainvoke = AsyncMock(side_effect=side_effect)
+    return mock_llm
+
   with patch("src.tools.drool_filter.get_chat_model", return_value=mock_llm):
-    result = await filter_drool_files("BRD for LC0070", ["test.drl", "test.md"])
+    yield _make
+
+
+@pytest.mark.asyncio
+async def test_filter_empty_paths():
+  result = await filter_drool_files("query", [])
+  assert result == {"included": [], "excluded": []}
+
+
+@pytest.mark.asyncio
+async def test_filter_include_exclude(filter_llm):
+  verdicts = {
+    "test.drl": FileRelevance(include=True, reason="relevant"),
+    "test.md": FileRelevance(include=False, reason="not relevant"),
+  }
+  # Files are classified concurrently, so answer by file rather than call order
+  mock_llm = filter_llm(lambda messages: verdicts[messages[1][1].split("\n", 1)[0].removeprefix("FILE: ")])
+
+  result = await filter_drool_files("BRD for LC0070", ["test.drl", "test.md"])
 
   assert set(result["included"]) == {"test.drl"}
   assert set(result["excluded"]) == {"test.md"}
@@ -34,17 +51,103 @@ async def test_filter_include_exclude(test_corpus_dir, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_filter_error_conservative_include(test_corpus_dir, monkeypatch):
-  monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-  from src.config import reset_config
+async def test_filter_error_conservative_include(filter_llm):
+  filter_llm(RuntimeError("API error"))
+
+  result = await filter_drool_files("query", ["test.drl"])
+
+  assert result["included"] == ["test.drl"]
+  assert result["excluded"] == []
+
+
+@pytest.mark.asyncio
+async def test_filter_error_skips_queued_calls(filter_llm, monkeypatch):
+  """After the first failure, files still waiting for a slot are included without an LLM call."""
+  monkeypatch.setenv("LLM_CONCURRENCY", "1")
   reset_config()
+  mock_llm = filter_llm(TimeoutError("Request timed out"))
 
-  mock_llm = MagicMock()
-  mock_llm.ainvoke = AsyncMock(side_effect=RuntimeError("API error"))
-  mock_llm.with_structured_output = MagicMock(return_value=mock_llm)
+  files = ["test.drl", "test.md", "test.txt", "test.jsonl"]
+  result = await filter_drool_files("query", files)
+
+  assert result["included"] == files
+  assert mock_llm.ainvoke.call_count == 1
 
-  with patch("src.tools.drool_filter.get_chat_model", return_value=mock_llm):
-    result = await filter_drool_files("query", ["test.drl"])
+
+@pytest.mark.asyncio
+async def test_filter_per_file_error_keeps_filtering(filter_llm, monkeypatch):
+  """A failure tied to one file (e.g. context length) includes that file only; others are still classified."""
+  monkeypatch.setenv("LLM_CONCURRENCY", "1")
+  reset_config()
+
+  def _answer(messages):
+    if messages[1][1].startswith("FILE: test.drl\n"):
+      raise ValueError("maximum context length exceeded")
+    return FileRelevance(include=False, reason="not relevant")
+
+  mock_llm = filter_llm(_answer)
+
+  result = await filter_drool_files("query", ["test.drl", "test.md", "test.txt"])
 
   assert result["included"] == ["test.drl"]
-  assert result["excluded"] == []
+  assert result["excluded"] == ["test.md", "test.txt"]
+  assert mock_llm.ainvoke.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_filter_shares_system_prefix(filter_llm):
+  """Every call sends the same system message; only the file message differs."""
+  mock_llm = filter_llm(lambda messages: FileRelevance(include=True, reason="ok"))
+
+  await filter_drool_files("BRD for LC0070", ["test.drl", "test.md"])
+
+  (first,), (second,) = (c.args for c in mock_llm.ainvoke.call_args_list)
+  assert first[0] == second[0]
+  assert "BRD for LC0070" in first[0][1]
+  assert first[1][1].startswith("FILE: ")
+  assert first[1] != second[1]
+
+
+@pytest.mark.asyncio
+async def test_filter_bounds_concurrent_llm_calls(filter_llm, monkeypatch):
+  """No more than LLM_CONCURRENCY relevance calls are in flight at once."""
+  import asyncio
+  monkeypatch.setenv("LLM_CONCURRENCY", "2")
+  reset_config()
+
+  in_flight = peak = 0
+
+  async def _ainvoke(messages):
+    nonlocal in_flight, peak
+    in_flight += 1
+    peak = max(peak, in_flight)
+    await asyncio.sleep(0.01)
+    in_flight -= 1
+    return FileRelevance(include=True, reason="ok")
+
+  filter_llm(_ainvoke)
+
+  files = ["test.drl", "test.md", "test.txt", "test.jsonl"]
+  result = await filter_drool_files("query", files)
+
+  assert sorted(result["included"]) == sorted(files)
+  assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_verdict_cache_skips_repeat_calls(filter_llm, tmp_path, monkeypatch):
+  """With RESPONSE_CACHE_DIR set, an unchanged (query, file, model) is classified once."""
+  monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+  monkeypatch.setenv("LLM_MODEL_PROVIDER", "openai")
+  reset_config()
+  mock_llm = filter_llm(lambda messages: FileRelevance(include=False, reason="unrelated"))
+
+  first = await filter_drool_files("BRD for LC0070", ["test.drl"])
+  second = await filter_drool_files("BRD for LC0070", ["test.drl"])
+  await filter_drool_files("different query", ["test.drl"])
+  monkeypatch.setenv("LLM_MODEL_PROVIDER", "bedrock_converse")
+  reset_config()
+  await filter_drool_files("BRD for LC0070", ["test.drl"])
+
+  assert first == second == {"included": [], "excluded": ["test.drl"]}
+  assert mock_llm.ainvoke.call_count == 3
@@ -1,12 +1,31 @@
 """Tests for orchestrator and guardrails."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.orchestrator import BRDOrchestrator, group_files_by_workbook
+from src.config import get_config, reset_config
+from src.orchestrator import BRDOrchestrator, _gap_fingerprint, _parse_gaps, group_files_by_workbook
 from src.models import MessageStatus
 
 
+class _FakeAgent:
+  """Stand-in deepagents graph: ainvoke and astream(stream_mode="values") return one fixed state."""
+
+  def __init__(self, content: str = "# BRD section"):
+    self.result = {"messages": [SimpleNamespace(content=content)]}
+    self.ainvoke_calls = 0
+    self.astream_calls = 0
+
+  async def ainvoke(self, *args, **kwargs):
+    self.ainvoke_calls += 1
+    return self.result
+
+  async def astream(self, *args, **kwargs):
+    self.astream_calls += 1
+    yield self.result
+
+
 class TestInputGuardrail:
   """Test input guardrail validation."""
 
@@ -36,12 +55,56 @@ class TestInputGuardrail:
     assert not is_valid
     assert any("Dangerous" in v.message for v in violations)
 
+  def test_content_moderation_reports_every_category(self):
+    from src.guardrails import get_input_guardrail
+    guardrail = get_input_guardrail()
+    is_valid, violations = guardrail.validate_input("how to harm people with bomb making")
+    assert not is_valid
+    assert [v.message for v in violations] == [
+      "Content flagged: Self-harm",
+      "Content flagged: Dangerous content",
+    ]
+
+  def test_custom_banned_patterns_take_effect(self):
+    from src.guardrails import InputGuardrail
+    guardrail = InputGuardrail()
+    query = "Create BRD for legacy mainframe decommission"
+    assert guardrail.validate_input(query)[0]
+
+    guardrail.banned_patterns = [(r"(?i)\bmainframe\b", "Restricted system")]
+    is_valid, violations = guardrail.validate_input(query)
+    assert not is_valid
+    assert violations[0].message == "Content flagged: Restricted system"
+
+  def test_banned_patterns_with_groups_checked_individually(self):
+    from src.guardrails import InputGuardrail
+    guardrail = InputGuardrail()
+    guardrail.banned_patterns = [
+      (r"(x)", "A"),
+      (r"(?i)\b(\w+)\s+\1\b", "Repeat"),
+      (r"(?P<w>foo)", "Foo"),
+      (r"(?P<w>bar)", "Bar"),
+    ]
+    assert [v.message for v in guardrail.validate_input("the the query")[1]] == ["Content flagged: Repeat"]
+    assert [v.message for v in guardrail.validate_input("foo and bar")[1]] == [
+      "Content flagged: Foo",
+      "Content flagged: Bar",
+    ]
+
+  def test_banned_patterns_are_per_instance(self):
+    from src.guardrails import InputGuardrail
+    guardrail = InputGuardrail()
+    with pytest.raises(AttributeError):
+      guardrail.banned_patterns.append((r"mainframe", "Restricted system"))
+    guardrail.banned_patterns = [*guardrail.banned_patterns, (r"mainframe", "Restricted system")]
+    assert len(InputGuardrail().banned_patterns) == len(guardrail.banned_patterns) - 1
+    assert InputGuardrail().validate_input("Create BRD for mainframe")[0]
+
 
 class TestConfiguration:
   """Test configuration management."""
 
   def test_config_singleton(self):
-    from src.config import get_config, reset_config
     config1 = get_config()
     config2 = get_config()
     assert config1 is config2
@@ -50,28 +113,26 @@ class TestConfiguration:
     config3 = get_config()
     assert config3 is not config1
 
-  def test_config_env_override(self, monkeypatch):
-    from src.config import reset_config, get_config
+  @pytest.mark.parametrize("env,value,attr,expected", [
+    ("LLM_MODEL", "openai:gpt-3.5-turbo", "llm_model", "openai:gpt-3.5-turbo"),
+    ("AGENT_TIMEOUT_SEC", "120", "agent_timeout_sec", 120),
+    ("LLM_MODEL_PROVIDER", "bedrock_converse", "llm_model_provider", "bedrock_converse"),
+    ("REVIEWER_TIMEOUT_SEC", "900", "reviewer_timeout_sec", 900),
+    ("LLM_CONCURRENCY", "3", "llm_concurrency", 3),
+  ])
+  def test_config_env_override(self, monkeypatch, env, value, attr, expected):
     reset_config()
-    monkeypatch.setenv("LLM_MODEL", "openai:gpt-3.5-turbo")
-    monkeypatch.setenv("AGENT_TIMEOUT_SEC", "120")
-    config = get_config()
-    assert config.llm_model == "openai:gpt-3.5-turbo"
-    assert config.agent_timeout_sec == 120
-
-  def test_config_model_provider(self, monkeypatch):
-    from src.config import reset_config, get_config
-    reset_config()
-    monkeypatch.setenv("LLM_MODEL_PROVIDER", "bedrock_converse")
-    config = get_config()
-    assert config.llm_model_provider == "bedrock_converse"
+    monkeypatch.setenv(env, value)
+    assert getattr(get_config(), attr) == expected
 
-  def test_reviewer_timeout_sec(self, monkeypatch):
-    from src.config import reset_config, get_config
+  def test_manager_timeouts_override(self, monkeypatch):
     reset_config()
-    monkeypatch.setenv("REVIEWER_TIMEOUT_SEC", "900")
-    config = get_config()
-    assert config.reviewer_timeout_sec == 900
+    monkeypatch.setenv("MANAGER_TIMEOUTS_SEC", "drool=120, reviewer=900")
+    monkeypatch.setenv("AGENT_TIMEOUT_SEC", "300")
+    orchestrator = BRDOrchestrator()
+    assert orchestrator._get_timeout_sec("drool") == 120
+    assert orchestrator._get_timeout_sec("reviewer") == 900
+    assert orchestrator._get_timeout_sec("model") == 300
 
 
 @pytest.mark.asyncio
@@ -81,7 +142,6 @@ class TestBRDOrchestrator:
   async def test_invalid_input_returns_error(self, monkeypatch):
     """Empty query should fail validation."""
     monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
-    from src.config import reset_config
     reset_config()
 
     orchestrator = BRDOrchestrator()
@@ -95,7 +155,6 @@ class TestBRDOrchestrator:
   async def test_too_long_query_returns_error(self, monkeypatch):
     """Very long query should fail validation."""
     monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
-    from src.config import reset_config
     reset_config()
 
     orchestrator = BRDOrchestrator()
@@ -147,15 +206,12 @@ async def test_run_pipeline_success_with_mocked_managers(test_output_dir, monkey
   """Full pipeline run with mocked LLM agents (no real API calls)."""
   monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
   monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
-  from src.config import reset_config
   reset_config()
 
   from src.models import MessageStatus
   from src.orchestrator import BRDOrchestrator
 
-  mock_invoke_result = {"messages": [MagicMock(content="# BRD section")]}
-  mock_agent = MagicMock()
-  mock_agent.ainvoke = AsyncMock(return_value=mock_invoke_result)
+  mock_agent = _FakeAgent()
   mock_managers = {
     "drool": mock_agent,
     "model": mock_agent,
@@ -176,3 +232,286 @@ async def test_run_pipeline_success_with_mocked_managers(test_output_dir, monkey
   assert result.status == MessageStatus.SUCCESS
   assert result.execution_id
   assert len(result.all_messages) >= 1
+
+
+def test_run_pipeline_reusable_across_event_loops(test_output_dir, monkeypatch):
+  """The LLM semaphore is per run, so a contended instance can run again under a new loop."""
+  import asyncio
+  monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  monkeypatch.setenv("LLM_CONCURRENCY", "1")
+  reset_config()
+
+  from src.models import MessageStatus
+  from src.orchestrator import BRDOrchestrator
+
+  class _SlowAgent(_FakeAgent):
+    async def ainvoke(self, *args, **kwargs):
+      await asyncio.sleep(0.01)
+      return await super().ainvoke(*args, **kwargs)
+
+  agent = _SlowAgent()
+  managers = dict.fromkeys(["drool", "model", "outbound", "transformation", "inbound", "reviewer"], agent)
+  with patch.object(BRDOrchestrator, "_filter_drool_files", new_callable=AsyncMock, return_value=[]):
+    with patch("src.orchestrator.create_all_managers", return_value=managers):
+      orchestrator = BRDOrchestrator()
+      runs = []
+      for _ in range(2):
+        result = asyncio.run(orchestrator.run_pipeline("Create BRD for LC0070", ["Outbound/spec.md"]))
+        assert result.status == MessageStatus.SUCCESS
+        runs.append(agent.ainvoke_calls)
+
+  assert runs[1] == 2 * runs[0]
+
+
+@pytest.mark.asyncio
+async def test_process_feedback_builds_compact_request(test_output_dir, monkeypatch):
+  """Empty feedback is dropped and missing items are deduplicated in order."""
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  reset_config()
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.managers = {"drool": MagicMock()}
+  orchestrator._execute_manager = AsyncMock(return_value=None)
+  orchestrator._record_and_save = AsyncMock()
+
+  await orchestrator._process_feedback([
+    {"agent_id": "drool", "feedback": "Missing rule X", "missing_items": ["X", "Y"]},
+    {"agent_id": "drool", "feedback": "", "missing_items": ["Y", "Z"]},
+  ])
+
+  request = orchestrator._execute_manager.call_args.kwargs["feedback"]
+  assert request.feedback == "Missing rule X"
+  assert request.missing_items == ["X", "Y", "Z"]
+
+
+@pytest.mark.asyncio
+async def test_process_feedback_reruns_each_manager(test_output_dir, monkeypatch):
+  """Every manager with gaps is rerun once and recorded in gap order."""
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  reset_config()
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.managers = {"drool": MagicMock(), "model": MagicMock()}
+  orchestrator._execute_manager = AsyncMock(side_effect=lambda name, feedback=None: name)
+  orchestrator._record_and_save = AsyncMock()
+
+  await orchestrator._process_feedback([
+    {"agent_id": "model", "feedback": "Missing entity"},
+    {"agent_id": "unknown", "feedback": "ignored"},
+    {"agent_id": "drool", "feedback": "Missing rule"},
+  ])
+
+  recorded = [c.args for c in orchestrator._record_and_save.call_args_list]
+  assert recorded == [("model", "model"), ("drool", "drool")]
+
+
+@pytest.mark.asyncio
+async def test_process_feedback_reruns_downstream_after_upstream_saved(test_output_dir, monkeypatch):
+  """Transformation reads outbound's output, so its rerun starts only after outbound's is saved."""
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  reset_config()
+
+  events = []
+
+  async def _execute(name, feedback=None):
+    events.append(("start", name))
+    return name
+
+  async def _record(msg, name):
+    events.append(("saved", name))
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.managers = {"outbound": MagicMock(), "transformation": MagicMock(), "model": MagicMock()}
+  orchestrator._execute_manager = AsyncMock(side_effect=_execute)
+  orchestrator._record_and_save = AsyncMock(side_effect=_record)
+
+  await orchestrator._process_feedback([
+    {"agent_id": "transformation", "feedback": "Missing mapping"},
+    {"agent_id": "outbound", "feedback": "Missing interface"},
+    {"agent_id": "model", "feedback": "Missing entity"},
+  ])
+
+  assert events.index(("saved", "outbound")) < events.index(("start", "transformation"))
+  assert events.index(("start", "model")) < events.index(("saved", "outbound"))
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_llm_on_repeat_run(test_output_dir, tmp_path, monkeypatch):
+  """With RESPONSE_CACHE_DIR set, a repeat run only re-invokes the reviewer."""
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  monkeypatch.setenv("CORPUS_DIR", str(tmp_path / "corpus"))
+  monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+  reset_config()
+
+  mock_agent = _FakeAgent()
+  mock_managers = {n: mock_agent for n in ("drool", "model", "outbound", "transformation", "inbound", "reviewer")}
+  corpus_files = ["Outbound/spec.md", "Transformation/mappings.jsonl"]
+
+  with patch.object(BRDOrchestrator, "_filter_drool_files", new_callable=AsyncMock, return_value=[]):
+    with patch("src.orchestrator.create_all_managers", return_value=mock_managers):
+      first = await BRDOrchestrator().run_pipeline("Create BRD for LC0070", corpus_files)
+      calls_first = mock_agent.ainvoke_calls
+      second = await BRDOrchestrator().run_pipeline("Create BRD for LC0070", corpus_files)
+
+  assert first.status == second.status == MessageStatus.SUCCESS
+  assert mock_agent.ainvoke_calls == calls_first
+  assert mock_agent.astream_calls == 2
+  assert any(m.metadata.get("cache_hit") for m in second.all_messages)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_misses_when_model_changes(test_output_dir, tmp_path, monkeypatch):
+  """Switching LLM_MODEL must not serve the previous model's cached manager outputs."""
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  monkeypatch.setenv("CORPUS_DIR", str(tmp_path / "corpus"))
+  monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+  monkeypatch.setenv("LLM_MODEL", "openai:gpt-4")
+  reset_config()
+
+  mock_agent = _FakeAgent()
+  mock_managers = {n: mock_agent for n in ("drool", "model", "outbound", "transformation", "inbound", "reviewer")}
+  corpus_files = ["Outbound/spec.md", "Transformation/mappings.jsonl"]
+
+  with patch.object(BRDOrchestrator, "_filter_drool_files", new_callable=AsyncMock, return_value=[]):
+    with patch("src.orchestrator.create_all_managers", return_value=mock_managers):
+      await BRDOrchestrator().run_pipeline("Create BRD for LC0070", corpus_files)
+      calls_first = mock_agent.ainvoke_calls
+
+      monkeypatch.setenv("LLM_MODEL", "anthropic.claude-3")
+      monkeypatch.setenv("LLM_MODEL_PROVIDER", "bedrock_converse")
+      reset_config()
+      second = await BRDOrchestrator().run_pipeline("Create BRD for LC0070", corpus_files)
+
+  assert mock_agent.ainvoke_calls == 2 * calls_first
+  assert not any(m.metadata.get("cache_hit") for m in second.all_messages)
+
+
+def test_build_prompt_orders_stable_sections_first():
+  """Query and prior outputs precede the (sorted) file list; feedback comes last."""
+  from src.models import ExecutionContext, ReprocessRequest
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.context = ExecutionContext(user_query="Create BRD", corpus_files=[])
+  orchestrator._completed_agents = {"drool", "model"}
+
+  a = orchestrator._build_prompt("outbound", file_override=["b.jsonl", "a.jsonl"])
+  b = orchestrator._build_prompt("outbound", file_override=["c.jsonl"])
+  prefix = a[: a.index("FILES TO ANALYZE")]
+  assert b.startswith(prefix)
+  assert "read_agent_output('model')" in prefix
+  assert a.index("a.jsonl") < a.index("b.jsonl")
+
+  fb = ReprocessRequest(agent_id="outbound", domain="", feedback="Add X", context="")
+  c = orchestrator._build_prompt("outbound", feedback=fb, file_override=["a.jsonl"])
+  assert c.index("FILES TO ANALYZE") < c.index("REPROCESSING REQUEST")
+
+
+def test_build_prompt_independent_of_completion_order():
+  """Drool/model finish in race-dependent order; the prompt must not depend on it."""
+  from src.models import ExecutionContext
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.context = ExecutionContext(user_query="Create BRD", corpus_files=[])
+
+  orchestrator._completed_agents = {"model", "drool"}
+  a = orchestrator._build_prompt("reviewer", file_override=[])
+  orchestrator._completed_agents = {"drool", "model"}
+  b = orchestrator._build_prompt("reviewer", file_override=[])
+  assert a == b
+
+
+def test_build_prompt_reused_until_dependency_completes():
+  """Reviewer retries reuse the prompt; a newly completed dependency rebuilds it."""
+  from src.models import ExecutionContext
+
+  orchestrator = BRDOrchestrator()
+  orchestrator.context = ExecutionContext(user_query="Create BRD", corpus_files=[])
+  orchestrator._completed_agents = {"drool", "model"}
+
+  first = orchestrator._build_prompt("reviewer")
+  assert orchestrator._build_prompt("reviewer") is first
+
+  orchestrator._completed_agents.add("outbound")
+  rebuilt = orchestrator._build_prompt("reviewer")
+  assert rebuilt is not first
+  assert "read_agent_output('outbound')" in rebuilt
+
+
+@pytest.mark.asyncio
+async def test_reviewer_timeout_returns_partial_output(test_output_dir, monkeypatch):
+  """A reviewer timeout keeps the last streamed state as PARTIAL output."""
+  import asyncio
+  monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+  monkeypatch.setenv("REVIEWER_TIMEOUT_SEC", "1")
+  reset_config()
+
+  async def _slow_stream(*args, **kwargs):
+    yield {"messages": [SimpleNamespace(content="# Draft BRD")]}
+    await asyncio.sleep(5)
+
+  reviewer = MagicMock()
+  reviewer.astream = MagicMock(side_effect=_slow_stream)
+
+  from src.models import ExecutionContext
+  orchestrator = BRDOrchestrator()
+  orchestrator.context = ExecutionContext(user_query="Create BRD", corpus_files=[])
+  orchestrator.managers = {"reviewer": reviewer}
+
+  msg = await orchestrator._execute_manager("reviewer")
+  assert msg.status == MessageStatus.PARTIAL
+  assert msg.markdown_content == "# Draft BRD"
+
+
+@pytest.mark.asyncio
+async def test_reviewer_loop_stops_when_gaps_repeat():
+  """Identical gaps after a rerun end the loop instead of spending another review."""
+  from src.models import AgentMessage, AgentType
+
+  gaps = [{"agent_id": "model", "feedback": "Add X", "missing_items": ["b", "a"]}]
+  repeat = [{"agent_id": "model", "feedback": "Still X", "missing_items": ["a", "b"]}]
+  msgs = [
+    AgentMessage(agent_id="reviewer", agent_type=AgentType.MANAGER, metadata={"gaps": g})
+    for g in (gaps, repeat)
+  ]
+
+  orchestrator = BRDOrchestrator()
+  orchestrator._execute_manager = AsyncMock(side_effect=msgs)
+  orchestrator._process_feedback = AsyncMock()
+
+  result = await orchestrator._run_reviewer_loop()
+
+  assert result is msgs[1]
+  assert orchestrator._execute_manager.call_count == 2
+  orchestrator._process_feedback.assert_awaited_once()
+
+
+def test_parse_gaps_from_reviewer_output():
+  """Gap JSON is found inside markdown; outputs without it yield no gaps."""
+  content = (
+    "Review summary.\n```json\n"
+    '{"gaps_detected": true, "gaps": [{"agent_id": "drool", "missing_items": ["X"]}]}'
+    "\n```\n"
+  )
+  assert _parse_gaps(content) == [{"agent_id": "drool", "domain": "", "feedback": "", "missing_items": ["X"]}]
+  assert _parse_gaps("# Final BRD\nAll sections complete.") == []
+  assert _parse_gaps('{"gaps": [unterminated') == []
+
+
+def test_parse_gaps_normalizes_non_string_items():
+  """Structured missing items are stringified so gap fingerprints stay hashable."""
+  content = (
+    '{"gaps": [{"manager": "model", "feedback": null, '
+    '"missing_items": [{"entity": "Account"}, ["a", "b"], 3, "Customer"]}]}'
+  )
+  gaps = _parse_gaps(content)
+  assert gaps == [{
+    "manager": "model",
+    "agent_id": "model",
+    "domain": "",
+    "feedback": "",
+    "missing_items": ['{"entity": "Account"}', '["a", "b"]', "3", "Customer"],
+  }]
+  assert _gap_fingerprint(gaps) == frozenset({
+    ("model", ("3", "Customer", '["a", "b"]', '{"entity": "Account"}')),
+  })
@@ -2,58 +2,119 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
+from src.config import reset_config
+from src.tools import corpus_reader
 from src.tools.corpus_reader import read_corpus_file, read_file_as_text
 from src.tools.token_estimator import estimate_tokens, calculate_cost
 from src.tools.code_executor import execute_python
+from src.tools.agent_output import (
+  save_agent_output,
+  save_agent_output_chunks,
+  read_agent_output,
+  list_agent_outputs,
+  has_agent_outputs,
+  clear_agent_outputs,
+)
 
 
 class TestCorpusReader:
   """Test read_corpus_file."""
 
-  def test_read_jsonl(self, test_corpus_dir, monkeypatch):
+  @pytest.fixture(autouse=True)
+  def corpus_env(self, test_corpus_dir, monkeypatch):
+    """Point CORPUS_DIR at the shared sample corpus; tests needing their own files override it."""
     monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-    from src.config import reset_config
     reset_config()
 
+  def test_read_jsonl(self):
     result = read_corpus_file("test.jsonl")
     assert "JSONL File" in result
     assert "test content" in result or "id" in result
 
-  def test_read_markdown(self, test_corpus_dir, monkeypatch):
-    monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-    from src.config import reset_config
+  def test_read_json_pretty_prints(self, tmp_path, monkeypatch):
+    (tmp_path / "rules.json").write_text('{"name": "Zürich", "limits": [1, 2], "ratio": NaN}', encoding="utf-8")
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
     reset_config()
 
+    result = read_corpus_file("rules.json")
+    assert result.startswith("JSON File: rules.json\n{\n")
+    assert '"name": "Zürich"' in result
+    assert '"ratio": NaN' in result
+
+  def test_read_markdown(self):
     result = read_corpus_file("test.md")
     assert "# Test" in result
 
-  def test_read_text(self, test_corpus_dir, monkeypatch):
-    monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-    from src.config import reset_config
-    reset_config()
-
+  def test_read_text(self):
     result = read_corpus_file("test.txt")
     assert "Plain text content" in result
 
-  def test_read_drl(self, test_corpus_dir, monkeypatch):
-    monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-    from src.config import reset_config
-    reset_config()
-
+  def test_read_drl(self):
     result = read_corpus_file("test.drl")
     assert "rule" in result
     assert "test_rule" in result
 
-  def test_read_nonexistent(self, test_corpus_dir, monkeypatch):
-    monkeypatch.setenv("CORPUS_DIR", str(test_corpus_dir))
-    from src.config import reset_config
+  def test_read_text_normalizes_newlines_and_rejects_invalid_utf8(self, tmp_path, monkeypatch):
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
+    reset_config()
+
+    (tmp_path / "crlf.drl").write_bytes(b"rule \"x\"\r\nwhen\rend\r\n")
+    assert read_corpus_file("crlf.drl") == 'rule "x"\nwhen\nend\n'
+    (tmp_path / "latin1.drl").write_bytes(b"rule \"caf\xe9\"\nend\n")
+    assert read_corpus_file("latin1.drl").startswith("ERROR: Failed to read latin1.drl:")
+
+  def test_read_csv_preview(self, tmp_path, monkeypatch):
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
     reset_config()
 
+    (tmp_path / "big.csv").write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(100)))
+    result = read_corpus_file("big.csv", max_lines=5)
+    assert "Rows: 100 (showing 5)" in result
+    assert "4,n4" in result and "5,n5" not in result
+    assert "... (95 more rows)" in result
+
+  def test_read_nonexistent(self):
     result = read_corpus_file("nonexistent.txt")
     assert "ERROR" in result
     assert "not found" in result
 
+  def test_repeat_read_is_cached_until_file_changes(self, tmp_path, monkeypatch):
+    (tmp_path / "test.txt").write_text("Plain text content")
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
+    reset_config()
+
+    with patch.object(corpus_reader, "_read_formatted", wraps=corpus_reader._read_formatted) as parse:
+      first = read_corpus_file("test.txt")
+      assert read_corpus_file("test.txt") == first
+      assert parse.call_count == 1
+
+      (tmp_path / "test.txt").write_text("Edited plain text content")
+      assert read_corpus_file("test.txt") == "Edited plain text content"
+      assert parse.call_count == 2
+
+  def test_cache_is_bounded_by_total_chars(self, tmp_path, monkeypatch):
+    for name in ("a.txt", "b.txt", "c.txt"):
+      (tmp_path / name).write_text(name[0] * 40)
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
+    monkeypatch.setattr(corpus_reader, "_CACHE_MAX_CHARS", 100)
+    reset_config()
+
+    for name in ("a.txt", "b.txt", "c.txt"):
+      read_corpus_file(name)
+    assert corpus_reader._cache_chars == 80
+    assert [k[0] for k in corpus_reader._cache] == [str(tmp_path / "b.txt"), str(tmp_path / "c.txt")]
+
+  def test_error_results_are_not_cached(self, tmp_path, monkeypatch):
+    (tmp_path / "doc.pdf").write_bytes(b"%PDF")
+    monkeypatch.setenv("CORPUS_DIR", str(tmp_path))
+    reset_config()
+
+    with patch.object(corpus_reader, "_read_formatted", return_value="ERROR: pymupdf not installed"):
+      assert read_corpus_file("doc.pdf").startswith("ERROR:")
+    assert not corpus_reader._cache
+
 
 class TestReadFileAsText:
   """Test read_file_as_text (golden BRD .md / .docx)."""
@@ -79,13 +140,67 @@ class TestReadFileAsText:
     result = read_file_as_text(docx_path)
     assert "Golden BRD" in result or "paragraph" in result
 
+  def test_read_docx_matches_paragraph_text(self, tmp_path):
+    try:
+      from docx import Document
+      from docx.enum.text import WD_BREAK
+    except ImportError:
+      pytest.skip("python-docx not installed")
+    docx_path = tmp_path / "runs.docx"
+    doc = Document()
+    doc.add_heading("Title", 0)
+    para = doc.add_paragraph("a")
+    para.add_run("b\tc").add_break()
+    para.add_run("d").add_break(WD_BREAK.PAGE)
+    para.add_run("e")
+    doc.add_paragraph("   ")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "table cell"
+    doc.save(docx_path)
+
+    expected = "".join(p.text + "\n" for p in Document(str(docx_path)).paragraphs if p.text.strip())
+    assert read_file_as_text(docx_path) == "Word File: runs.docx\n\n" + expected
+
+
+class TestAgentOutput:
+  """Test agent output persistence helpers."""
+
+  def test_save_chunks_joins_with_separator(self, test_output_dir, monkeypatch):
+    monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+    reset_config()
+
+    save_agent_output_chunks("model", ["# A", "# B", "# C"], sep="\n---\n")
+    assert read_agent_output("model") == "# A\n---\n# B\n---\n# C"
+
+  def test_has_agent_outputs(self, test_output_dir, monkeypatch):
+    monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+    reset_config()
+
+    assert not has_agent_outputs()
+    save_agent_output("drool", "# Rules")
+    assert has_agent_outputs()
+    clear_agent_outputs()
+    assert not has_agent_outputs()
+
+  def test_list_agent_outputs_sorted_with_sizes(self, test_output_dir, monkeypatch):
+    monkeypatch.setenv("OUTPUT_DIR", str(test_output_dir))
+    reset_config()
+
+    assert list_agent_outputs() == "No agent outputs available yet."
+    save_agent_output("model", "# Model")
+    save_agent_output("drool", "# Rules")
+    (test_output_dir / "agent_outputs" / "notes.md").write_text("ignored")
+    assert list_agent_outputs() == (
+      "Available agent outputs:\n"
+      "  - drool (7 chars)\n"
+      "  - model (7 chars)"
+    )
+
 
 class TestTokenEstimator:
   """Test estimate_tokens and calculate_cost."""
 
   def test_estimate_tokens(self, monkeypatch):
     monkeypatch.setenv("INPUT_COST_PER_1K", "0.003")
-    from src.config import reset_config
     reset_config()
 
     result = estimate_tokens("This is a test string for token estimation.")
@@ -95,7 +210,6 @@ class TestTokenEstimator:
   def test_calculate_cost(self, monkeypatch):
     monkeypatch.setenv("INPUT_COST_PER_1K", "0.003")
     monkeypatch.setenv("OUTPUT_COST_PER_1K", "0.006")
-    from src.config import reset_config
     reset_config()
 
     result = calculate_cost(input_tokens=1000, output_tokens=500)
@@ -116,6 +230,11 @@ class TestCodeExecutor:
     result = execute_python("raise ValueError('test error')")
     assert "test error" in result or "ValueError" in result
 
+  def test_execute_error_traceback_shows_source(self):
+    result = execute_python("def f():\n  raise ValueError('boom')\nprint(__file__.endswith('.py'))\nf()\n")
+    assert "STDOUT:\nTrue" in result
+    assert "raise ValueError('boom')" in result
+
   def test_execute_timeout(self):
     result = execute_python("import time; time.sleep(10)", timeout_sec=1)
     assert "timed out" in result.lower() or "ERROR" in result